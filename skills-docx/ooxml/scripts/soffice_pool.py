@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+Pool of warm LibreOffice instances shared by the document scripts.
+
+Starting soffice costs several seconds per document. The pool keeps a number of
+headless instances running, each with its own user profile, and serves
+conversion and recalculation jobs over a local socket. pack.py, thumbnail.py
+and recalc.py send their jobs to the pool when it is running and spawn soffice
+themselves otherwise.
+
+The server drives LibreOffice through UNO, so it has to run under a Python that
+can import `uno` (LibreOffice's bundled python, or python3-uno). Clients only
+need the standard library.
+
+Connections are authenticated with a random key that the server writes to a
+file only the current user can read, next to the socket in a private runtime
+directory ($XDG_RUNTIME_DIR when set).
+
+Example usage:
+    python soffice_pool.py start [--workers N]
+    python soffice_pool.py status
+    python soffice_pool.py stop
+"""
+
+import argparse
+import getpass
+import json
+import os
+import queue
+import secrets
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+DEFAULT_WORKERS = 2
+DEFAULT_JOB_TIMEOUT = (
+    120  # Seconds a single job may take before its worker is restarted
+)
+STARTUP_TIMEOUT = 60  # Seconds to wait for a worker to accept UNO connections
+# Seconds a reply may lag behind the job timeout (killing soffice and
+# unwinding the UNO call) before the job is reported as timed out
+REPLY_MARGIN = 10
+CONTROL_TIMEOUT = 10  # Seconds to wait for a ping or stop reply
+AUTHKEY_FILE = "authkey"
+
+# Export filters used when a conversion only names the target extension,
+# keyed by (extension, document kind)
+EXPORT_FILTERS = {
+    ("pdf", "text"): "writer_pdf_Export",
+    ("pdf", "presentation"): "impress_pdf_Export",
+    ("pdf", "spreadsheet"): "calc_pdf_Export",
+    ("html", "text"): "HTML",
+    ("html", "presentation"): "impress_html_Export",
+    ("html", "spreadsheet"): "HTML (StarCalc)",
+}
+
+# Document services used to tell document kinds apart
+DOCUMENT_KINDS = {
+    "com.sun.star.text.TextDocument": "text",
+    "com.sun.star.presentation.PresentationDocument": "presentation",
+    "com.sun.star.sheet.SpreadsheetDocument": "spreadsheet",
+}
+
+
+class PoolUnavailable(Exception):
+    """Raised when no pool is listening on the requested address."""
+
+
+def runtime_dir():
+    """Return the per-user directory holding the pool's socket and key."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home()
+        return Path(base) / "soffice-pool"
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "soffice-pool"
+    return Path(tempfile.gettempdir()) / f"soffice-pool-{getpass.getuser()}"
+
+
+def default_address():
+    """Return the pool address, overridable with $SOFFICE_POOL_ADDRESS."""
+    if "SOFFICE_POOL_ADDRESS" in os.environ:
+        return os.environ["SOFFICE_POOL_ADDRESS"]
+    if sys.platform == "win32":
+        return rf"\\.\pipe\soffice-pool-{getpass.getuser()}"
+    # The socket lives in a directory only the current user can access
+    return str(runtime_dir() / "pool.sock")
+
+
+def _check_private(path, mode):
+    """Raise PermissionError unless path is owned by us with exactly this mode.
+
+    Windows has no POSIX owner or mode; there the per-user profile directory
+    and the authentication key protect the pool.
+    """
+    if sys.platform == "win32":
+        return
+    stat = os.lstat(path)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o777 != mode:
+        raise PermissionError(
+            f"{path} must be owned by the current user with mode {mode:o}"
+        )
+
+
+def _read_authkey():
+    """Read the key the running pool authenticates connections with."""
+    key_path = runtime_dir() / AUTHKEY_FILE
+    _check_private(key_path.parent, 0o700)
+    _check_private(key_path, 0o600)
+    return key_path.read_bytes()
+
+
+def request(job, address=None):
+    """Send a job to the pool and return its response.
+
+    Args:
+        job: JSON-serializable dict with an "op" key
+        address: Pool address (default: default_address())
+
+    Returns:
+        dict: Response with "ok" and either the job's results or "error"
+
+    Raises:
+        PoolUnavailable: If no pool is listening on the address
+    """
+    address = address or default_address()
+    try:
+        conn = Client(address, authkey=_read_authkey())
+    except (OSError, EOFError, AuthenticationError) as e:
+        raise PoolUnavailable(f"No soffice pool at {address}: {e}") from e
+
+    if job["op"] in ("ping", "stop"):
+        reply_timeout = CONTROL_TIMEOUT
+    else:
+        # Time spent queued behind other jobs counts against this as well
+        reply_timeout = (job.get("timeout") or DEFAULT_JOB_TIMEOUT) + REPLY_MARGIN
+
+    with conn:
+        try:
+            conn.send_bytes(json.dumps(job).encode("utf-8"))
+            if not conn.poll(reply_timeout):
+                return {
+                    "ok": False,
+                    "error": f"No reply from soffice pool after {reply_timeout}s",
+                    "timed_out": True,
+                }
+            return json.loads(conn.recv_bytes())
+        except (OSError, EOFError) as e:
+            return {"ok": False, "error": f"Lost connection to soffice pool: {e}"}
+
+
+def is_running(address=None):
+    """Return True if a pool is answering on the address."""
+    try:
+        return request({"op": "ping"}, address).get("ok", False)
+    except PoolUnavailable:
+        return False
+
+
+def convert(path, convert_to, outdir, timeout=None, address=None):
+    """Convert a document like `soffice --convert-to convert_to --outdir outdir`.
+
+    Args:
+        path: Document to convert
+        convert_to: Target extension, optionally with a filter ("pdf", "html:HTML")
+        outdir: Directory for the converted file, named after the input's stem
+        timeout: Seconds before the job is abandoned (default: DEFAULT_JOB_TIMEOUT)
+        address: Pool address (default: default_address())
+
+    Returns:
+        dict: {"ok": True, "output": path} or {"ok": False, "error": message}
+    """
+    job = {
+        "op": "convert",
+        "path": str(Path(path).resolve()),
+        "convert_to": convert_to,
+        "outdir": str(Path(outdir).resolve()),
+        "timeout": timeout,
+    }
+    return request(job, address)
+
+
+def recalc(path, timeout=None, address=None):
+    """Recalculate all formulas of a spreadsheet and save it in place.
+
+    Returns:
+        dict: {"ok": True} or {"ok": False, "error": message}; timed-out jobs
+        also carry "timed_out": True
+    """
+    job = {"op": "recalc", "path": str(Path(path).resolve()), "timeout": timeout}
+    return request(job, address)
+
+
+class SofficeWorker:
+    """One headless soffice instance with a private profile, driven over UNO."""
+
+    def __init__(self, index, profile_dir):
+        self.index = index
+        self.profile_dir = Path(profile_dir)
+        self.pipe_name = f"soffice-pool-{os.getpid()}-{index}"
+        self.process = None
+        self.desktop = None
+        self.timed_out = False
+
+    def start(self):
+        """Launch soffice and connect to it."""
+        import uno
+        from com.sun.star.connection import NoConnectException
+
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"-env:UserInstallation={self.profile_dir.as_uri()}",
+                f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+                )
+                break
+            except NoConnectException:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError(f"soffice worker {self.index} failed to start")
+                time.sleep(0.25)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def stop(self):
+        """Terminate soffice, killing it if it does not exit promptly."""
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+    def _kill(self):
+        self.timed_out = True
+        if self.process is not None:
+            self.process.kill()
+
+    def run(self, job):
+        """Run a convert or recalc job and return its response."""
+        timeout = job.get("timeout") or DEFAULT_JOB_TIMEOUT
+        self.timed_out = False
+        timer = threading.Timer(timeout, self._kill)
+        timer.start()
+        try:
+            if job["op"] == "convert":
+                response = self._convert(job["path"], job["convert_to"], job["outdir"])
+            elif job["op"] == "recalc":
+                response = self._recalc(job["path"])
+            else:
+                response = {"ok": False, "error": f"Unknown job type: {job['op']}"}
+        except Exception as e:
+            if self.timed_out:
+                response = {
+                    "ok": False,
+                    "error": f"Timeout after {timeout}s",
+                    "timed_out": True,
+                }
+            else:
+                response = {"ok": False, "error": str(e)}
+        finally:
+            timer.cancel()
+        return response
+
+    def is_alive(self):
+        """Return True if soffice is still running (it may have crashed or timed out)."""
+        return self.process is not None and self.process.poll() is None
+
+    def _load(self, path):
+        import uno
+
+        document = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(path), "_blank", 0, _properties(Hidden=True)
+        )
+        if document is None:
+            raise RuntimeError(f"Could not load {path}")
+        return document
+
+    def _convert(self, path, convert_to, outdir):
+        import uno
+
+        extension, _, filter_name = convert_to.partition(":")
+        document = self._load(path)
+        try:
+            if not filter_name:
+                kind = next(
+                    (
+                        kind
+                        for service, kind in DOCUMENT_KINDS.items()
+                        if document.supportsService(service)
+                    ),
+                    None,
+                )
+                filter_name = EXPORT_FILTERS.get((extension, kind))
+                if filter_name is None:
+                    return {
+                        "ok": False,
+                        "error": f"No default filter for {extension}, "
+                        f"use {extension}:<filter name>",
+                    }
+
+            output = Path(outdir) / f"{Path(path).stem}.{extension}"
+            document.storeToURL(
+                uno.systemPathToFileUrl(str(output)),
+                _properties(FilterName=filter_name),
+            )
+        finally:
+            document.close(True)
+        return {"ok": True, "output": str(output)}
+
+    def _recalc(self, path):
+        document = self._load(path)
+        try:
+            document.calculateAll()
+            document.store()
+        finally:
+            document.close(True)
+        return {"ok": True}
+
+
+def _properties(**values):
+    """Build a tuple of UNO PropertyValues from keyword arguments."""
+    from com.sun.star.beans import PropertyValue
+
+    return tuple(
+        PropertyValue(Name=name, Value=value) for name, value in values.items()
+    )
+
+
+class SofficePool:
+    """Serve jobs from a fixed set of SofficeWorkers over a local socket."""
+
+    def __init__(self, workers=DEFAULT_WORKERS, address=None):
+        self.address = address or default_address()
+        self.profiles_dir = Path(tempfile.mkdtemp(prefix="soffice-pool-"))
+        self.workers = [
+            SofficeWorker(i, self.profiles_dir / f"profile-{i}") for i in range(workers)
+        ]
+        self.jobs = queue.Queue()
+        self.listener = None
+        self.authkey = None
+        self.stopping = False
+        # Workers still serving jobs; guarded by lock together with self.jobs
+        # so that no job is queued after the last worker is gone
+        self.live_workers = workers
+        self.lock = threading.Lock()
+
+    def serve_forever(self):
+        """Start the workers and answer requests until a stop request arrives."""
+        self._prepare_address()
+        try:
+            # Workers start in parallel so startup costs one cold start, not N
+            starters = [threading.Thread(target=w.start) for w in self.workers]
+            for thread in starters:
+                thread.start()
+            for thread in starters:
+                thread.join()
+            for worker in self.workers:
+                if worker.desktop is None:
+                    raise RuntimeError(f"soffice worker {worker.index} failed to start")
+                threading.Thread(target=self._work, args=(worker,), daemon=True).start()
+
+            self.listener = Listener(self.address, authkey=self.authkey)
+            print(f"soffice pool with {len(self.workers)} worker(s) at {self.address}")
+            while not self.stopping:
+                try:
+                    conn = self.listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self._shutdown()
+
+    def _prepare_address(self):
+        # Refuse directories another user could have planted or can write to
+        key_dir = runtime_dir()
+        key_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            _check_private(key_dir, 0o700)
+        except PermissionError as e:
+            raise RuntimeError(str(e)) from e
+
+        if is_running(self.address):
+            raise RuntimeError(f"An soffice pool is already running at {self.address}")
+
+        # A fresh key per pool, written atomically with owner-only permissions
+        self.authkey = secrets.token_bytes(32)
+        key_path = key_dir / AUTHKEY_FILE
+        temp_path = key_path.with_name(f"{AUTHKEY_FILE}.part")
+        temp_path.unlink(missing_ok=True)
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.authkey)
+        os.replace(temp_path, key_path)
+
+        if sys.platform == "win32":
+            return
+        socket_path = Path(self.address)
+        if socket_path.parent != key_dir:
+            socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            try:
+                _check_private(socket_path.parent, 0o700)
+            except PermissionError as e:
+                raise RuntimeError(str(e)) from e
+        socket_path.unlink(missing_ok=True)  # Left behind by a pool that crashed
+
+    def _work(self, worker):
+        while True:
+            job, replies, started = self.jobs.get()
+            started.set()
+            replies.put(worker.run(job))
+
+            # Replace instances that crashed or were killed by the timer
+            if not worker.is_alive():
+                worker.stop()
+                try:
+                    worker.start()
+                except Exception as e:
+                    print(f"Error: Could not restart worker: {e}", file=sys.stderr)
+                    self._drop_worker()
+                    return
+
+    def _drop_worker(self):
+        """Stop counting a worker that is gone; fail queued jobs if it was the last."""
+        with self.lock:
+            self.live_workers -= 1
+            if self.live_workers > 0:
+                return
+            while True:
+                try:
+                    _, replies, _ = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                replies.put({"ok": False, "error": "No soffice workers left"})
+        print("Error: No soffice workers left", file=sys.stderr)
+
+    def _submit(self, job):
+        """Queue a job and wait for its reply, bounded by the job timeout."""
+        replies = queue.Queue(maxsize=1)
+        started = threading.Event()
+        with self.lock:
+            if self.live_workers == 0:
+                return {"ok": False, "error": "No soffice workers left"}
+            self.jobs.put((job, replies, started))
+
+        # Queued jobs wait for a worker; jobs failed while queued never start
+        while not started.wait(1):
+            if not replies.empty():
+                return replies.get()
+
+        timeout = (job.get("timeout") or DEFAULT_JOB_TIMEOUT) + REPLY_MARGIN
+        try:
+            return replies.get(timeout=timeout)
+        except queue.Empty:
+            return {
+                "ok": False,
+                "error": f"No reply from soffice worker after {timeout}s",
+                "timed_out": True,
+            }
+
+    def _handle(self, conn):
+        with conn:
+            try:
+                job = json.loads(conn.recv_bytes())
+            except (OSError, EOFError, ValueError):
+                return
+
+            if job.get("op") == "ping":
+                if self.live_workers:
+                    response = {"ok": True, "workers": self.live_workers}
+                else:
+                    response = {"ok": False, "error": "No soffice workers left"}
+            elif job.get("op") == "stop":
+                response = {"ok": True}
+                self.stopping = True
+            else:
+                response = self._submit(job)
+
+            try:
+                conn.send_bytes(json.dumps(response).encode("utf-8"))
+            except OSError:
+                pass  # Client went away
+
+        if self.stopping:
+            # Wake up the accept() loop so it sees the stop request
+            try:
+                Client(self.address, authkey=self.authkey).close()
+            except (OSError, EOFError, AuthenticationError):
+                pass
+
+    def _shutdown(self):
+        if self.listener is not None:
+            self.listener.close()
+        if self.authkey is not None:
+            (runtime_dir() / AUTHKEY_FILE).unlink(missing_ok=True)
+        for worker in self.workers:
+            worker.stop()
+        shutil.rmtree(self.profiles_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pool of warm LibreOffice instances")
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of soffice instances to keep running (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--address", help="Socket or pipe to listen on (default: per-user socket)"
+    )
+    args = parser.parse_args()
+
+    match args.command:
+        case "start":
+            if args.workers < 1:
+                sys.exit("Error: --workers must be at least 1")
+            try:
+                SofficePool(args.workers, args.address).serve_forever()
+            except RuntimeError as e:
+                sys.exit(f"Error: {e}")
+        case "status":
+            try:
+                response = request({"op": "ping"}, args.address)
+            except PoolUnavailable as e:
+                sys.exit(str(e))
+            if not response["ok"]:
+                sys.exit(f"soffice pool not serving jobs: {response['error']}")
+            print(f"soffice pool running with {response['workers']} worker(s)")
+        case "stop":
+            try:
+                request({"op": "stop"}, args.address)
+            except PoolUnavailable as e:
+                sys.exit(str(e))
+            print("soffice pool stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,45 @@
 Base validator with common validation logic for document files.
 """
 
+import hashlib
+import inspect
+import json
+import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import lxml.etree
 
+# Compiled XSD schemas shared by every validator in this process, keyed by the
+# resolved schema path. Compiling the OOXML schema set is far more expensive than
+# validating a single part against it, so each schema is compiled at most once.
+_SCHEMA_CACHE = {}
+
+# Marks a per-part result that has to be (re)computed in incremental mode
+_MISSING = object()
+
+# Manifest versions of each validator class, see BaseSchemaValidator._manifest_version
+_MANIFEST_VERSIONS = {}
+
+# Validators reused by pool workers across the parts they are handed, keyed by
+# (validator class, unpacked_dir, original_file)
+_WORKER_VALIDATORS = {}
+
+
+def _validate_file_against_xsd_in_worker(
+    validator_class, unpacked_dir, original_file, xml_file
+):
+    """Validate one part against its XSD schema inside a pool worker process."""
+    key = (validator_class, unpacked_dir, original_file)
+    validator = _WORKER_VALIDATORS.get(key)
+    if validator is None:
+        validator = validator_class(unpacked_dir, original_file)
+        _WORKER_VALIDATORS[key] = validator
+    return validator.validate_file_against_xsd(xml_file, verbose=False)
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -81,6 +115,10 @@ class BaseSchemaValidator:
         "http://schemas.openxmlformats.org/package/2006/content-types"
     )
 
+    # Bump when per-part results change shape, to invalidate stored manifests.
+    # Edits to the schemas or validator modules invalidate them automatically.
+    MANIFEST_VERSION = 1
+
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
@@ -103,11 +141,19 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, jobs=1, incremental=False
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Number of worker processes for per-part checks (1 runs them serially)
+        self.jobs = jobs
+
+        # Reuse per-part results of the previous run for unchanged parts
+        self.incremental = incremental
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
@@ -120,28 +166,192 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # XSD errors of each part in the original file, keyed by relative path
+        self._original_file_errors = {}
+
+        # Parsed XML trees shared by all checks, keyed by file path
+        self._parsed_trees = {}
+
+        # Content hashes of files read in this run, keyed by file path
+        self._file_digests = {}
+
+        # Per-part results: loaded from the previous run and produced by this one
+        self._previous_manifest = self._load_manifest() if incremental else {}
+        self._manifest = {"parts": {}, "original": {}}
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _parse_xml_file(self, xml_file):
+        """Parse an XML file once per validator run and return the cached tree.
+
+        Every check reads the same lxml ElementTree, so callers must treat it as
+        read-only and work on a copy if they need to modify it. Files that fail
+        to parse are not cached and raise XMLSyntaxError on every call.
+        """
+        xml_file = Path(xml_file)
+        tree = self._parsed_trees.get(xml_file)
+        if tree is None:
+            tree = lxml.etree.parse(str(xml_file))
+            self._parsed_trees[xml_file] = tree
+        return tree
+
+    def _manifest_path(self):
+        """Path of the manifest storing per-part results between incremental runs."""
+        key = hashlib.sha1(
+            f"{type(self).__name__}:{self.unpacked_dir}".encode("utf-8")
+        ).hexdigest()
+        return Path(tempfile.gettempdir()) / "ooxml-validation" / f"{key}.json"
+
+    def _original_signature(self):
+        """Identify the original file by path, size and modification time."""
+        stat = self.original_file.stat()
+        return [str(self.original_file.resolve()), stat.st_size, stat.st_mtime_ns]
+
+    def _manifest_version(self):
+        """Version stored with manifests: MANIFEST_VERSION and a hash of the schema
+        files and of the modules defining this validator class."""
+        validator_class = type(self)
+        version = _MANIFEST_VERSIONS.get(validator_class)
+        if version is None:
+            digest = hashlib.sha256(str(self.MANIFEST_VERSION).encode("utf-8"))
+            schema_files = sorted(f for f in self.schemas_dir.rglob("*") if f.is_file())
+            modules = sorted(
+                {Path(inspect.getfile(c)) for c in validator_class.__mro__[:-1]}
+            )
+            for file_path in schema_files + modules:
+                digest.update(f"{file_path.name}:".encode("utf-8"))
+                digest.update(hashlib.sha256(file_path.read_bytes()).digest())
+            version = f"{self.MANIFEST_VERSION}-{digest.hexdigest()}"
+            _MANIFEST_VERSIONS[validator_class] = version
+        return version
+
+    def _load_manifest(self):
+        """Load the previous run's manifest if it was made for the same original."""
+        try:
+            manifest = json.loads(self._manifest_path().read_text(encoding="utf-8"))
+            signature = self._original_signature()
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            manifest.get("version") != self._manifest_version()
+            or manifest.get("signature") != signature
+        ):
+            return {}
+        return manifest
+
+    def _save_manifest(self):
+        """Store this run's per-part results for the next incremental run.
+
+        Results of the previous run are carried over for parts that still exist
+        but were not visited this time (e.g. when validation stopped early).
+        """
+        if not self.incremental:
+            return
+
+        current_parts = {self._part_key(f) for f in self.xml_files}
+        parts = {
+            key: dict(checks)
+            for key, checks in self._previous_manifest.get("parts", {}).items()
+            if key in current_parts
+        }
+        for key, checks in self._manifest["parts"].items():
+            parts.setdefault(key, {}).update(checks)
+
+        original = dict(self._previous_manifest.get("original", {}))
+        original.update(self._manifest["original"])
+
+        manifest_path = self._manifest_path()
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = manifest_path.with_suffix(".tmp")
+            temp_path.write_text(
+                json.dumps(
+                    {
+                        "version": self._manifest_version(),
+                        "signature": self._original_signature(),
+                        "parts": parts,
+                        "original": original,
+                    }
+                ),
+                encoding="utf-8",
+            )
+            temp_path.replace(manifest_path)
+        except OSError as e:
+            if self.verbose:
+                print(f"Warning: Could not save validation manifest: {e}")
+
+    def _part_key(self, path):
+        """Manifest key of a file: its POSIX path relative to unpacked_dir."""
+        return Path(path).relative_to(self.unpacked_dir).as_posix()
+
+    def _file_digest(self, path):
+        """Return the SHA-1 of a file's content (None if it cannot be read)."""
+        path = Path(path)
+        if path not in self._file_digests:
+            try:
+                self._file_digests[path] = hashlib.sha1(path.read_bytes()).hexdigest()
+            except OSError:
+                self._file_digests[path] = None
+        return self._file_digests[path]
+
+    def _lookup_part_result(self, check_name, xml_file, depends_on=()):
+        """Return (digest, result) for a per-part check.
+
+        result is the previous run's result if neither xml_file nor any file in
+        depends_on changed since then, otherwise _MISSING.
+        """
+        digest = "/".join(str(self._file_digest(f)) for f in (xml_file, *depends_on))
+        entry = (
+            self._previous_manifest.get("parts", {})
+            .get(self._part_key(xml_file), {})
+            .get(check_name)
+        )
+        if entry is not None and entry["digest"] == digest:
+            return digest, entry["result"]
+        return digest, _MISSING
+
+    def _store_part_result(self, check_name, xml_file, digest, result):
+        """Record a per-part result in this run's manifest."""
+        self._manifest["parts"].setdefault(self._part_key(xml_file), {})[
+            check_name
+        ] = {"digest": digest, "result": result}
+
+    def _cached_part_result(self, check_name, xml_file, compute, depends_on=()):
+        """Run compute(xml_file), reusing the previous result in incremental mode.
+
+        compute must return a JSON-serializable value built from lists, not
+        tuples, that depends only on xml_file and the files in depends_on.
+        """
+        if not self.incremental:
+            return compute(xml_file)
+
+        digest, result = self._lookup_part_result(check_name, xml_file, depends_on)
+        if result is _MISSING:
+            result = compute(xml_file)
+        self._store_part_result(check_name, xml_file, digest, result)
+        return result
+
+    def _cached_original_result(self, check_name, compute):
+        """Run compute(), reusing the previous result for the same original file."""
+        if not self.incremental:
+            return compute()
+
+        original = self._previous_manifest.get("original", {})
+        result = original[check_name] if check_name in original else compute()
+        self._manifest["original"][check_name] = result
+        return result
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+            errors.extend(
+                self._cached_part_result("xml", xml_file, self._check_xml_part)
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -153,26 +363,33 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _check_xml_part(self, xml_file):
+        """Return well-formedness errors for a single XML file."""
+        try:
+            # Try to parse the XML file
+            self._parse_xml_file(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Line {e.lineno}: {e.msg}"
+            ]
+        except Exception as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Unexpected error: {str(e)}"
+            ]
+        return []
+
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+            errors.extend(
+                self._cached_part_result(
+                    "namespaces", xml_file, self._check_namespaces_part
+                )
+            )
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -183,86 +400,55 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _check_namespaces_part(self, xml_file):
+        """Return undeclared Ignorable namespace errors for a single XML file."""
+        errors = []
+        try:
+            root = self._parse_xml_file(xml_file).getroot()
+            declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+            for attr_val in [
+                v for k, v in root.attrib.items() if k.endswith("Ignorable")
+            ]:
+                undeclared = set(attr_val.split()) - declared
+                errors.extend(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Namespace '{ns}' in Ignorable but not declared"
+                    for ns in undeclared
+                )
+        except lxml.etree.XMLSyntaxError:
+            pass
+        return errors
+
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+            # Replay file-level errors and global IDs in document order
+            for event in self._cached_part_result(
+                "unique_ids", xml_file, self._collect_unique_ids_part
+            ):
+                if event[0] == "error":
+                    errors.append(event[1])
+                    continue
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                # Check global uniqueness
+                _, id_value, sourceline, tag = event
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {sourceline}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        sourceline,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,6 +460,79 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _collect_unique_ids_part(self, xml_file):
+        """Collect ID events for a single XML file, in document order.
+
+        Returns a list of ["error", message] for file-level violations and
+        ["global", id_value, sourceline, tag] for IDs that must be unique
+        across all files, which validate_unique_ids checks afterwards.
+        """
+        events = []
+        try:
+            root = self._parse_xml_file(xml_file).getroot()
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # Skip everything inside mc:AlternateContent elements (the parsed
+            # tree is shared with other checks, so it must not be modified)
+            mc_elements = root.xpath(
+                ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+            )
+            skipped = {sub for elem in mc_elements for sub in elem.iter()}
+
+            # Now check IDs outside the alternate content
+            for elem in root.iter():
+                if elem in skipped:
+                    continue
+
+                # Get the element name without namespace
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                # Check if this element type has ID uniqueness requirements
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            events.append(["global", id_value, elem.sourceline, tag])
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                events.append(
+                                    [
+                                        "error",
+                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                        f"(first occurrence at line {prev_line})",
+                                    ]
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            events.append(
+                ["error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"]
+            )
+        return events
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -296,7 +555,7 @@ class BaseSchemaValidator:
                 and file_path.name != "[Content_Types].xml"
                 and not file_path.name.endswith(".rels")
             ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+                all_files.append(file_path)
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
@@ -310,7 +569,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml_file(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -337,9 +596,10 @@ class BaseSchemaValidator:
                             base_dir = rels_dir.parent
                             target_path = base_dir / target
 
-                        # Normalize the path and check if it exists
+                        # Normalize the path and check if it exists; ".." is
+                        # resolved lexically so symlinked files stay in the tree
                         try:
-                            target_path = target_path.resolve()
+                            target_path = Path(os.path.normpath(target_path))
                             if target_path.exists() and target_path.is_file():
                                 referenced_files.add(target_path)
                                 all_referenced_files.add(target_path)
@@ -390,8 +650,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -409,68 +667,16 @@ class BaseSchemaValidator:
             if not rels_file.exists():
                 continue
 
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+            errors.extend(
+                self._cached_part_result(
+                    "relationship_ids",
+                    xml_file,
+                    lambda xml_file: self._check_relationship_ids_part(
+                        xml_file, rels_file
+                    ),
+                    depends_on=(rels_file,),
+                )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -483,6 +689,75 @@ class BaseSchemaValidator:
                 print("PASSED - All relationship ID references are valid")
             return True
 
+    def _check_relationship_ids_part(self, xml_file, rels_file):
+        """Return r:id reference errors for one XML file against its .rels file."""
+        errors = []
+
+        try:
+            # Parse the .rels file to get valid relationship IDs and their types
+            rels_root = self._parse_xml_file(rels_file).getroot()
+            rid_to_type = {}
+
+            for rel in rels_root.findall(
+                f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            ):
+                rid = rel.get("Id")
+                rel_type = rel.get("Type", "")
+                if rid:
+                    # Check for duplicate rIds
+                    if rid in rid_to_type:
+                        rels_rel_path = rels_file.relative_to(self.unpacked_dir)
+                        errors.append(
+                            f"  {rels_rel_path}: Line {rel.sourceline}: "
+                            f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                        )
+                    # Extract just the type name from the full URL
+                    type_name = (
+                        rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                    )
+                    rid_to_type[rid] = type_name
+
+            # Parse the XML file to find all r:id references
+            xml_root = self._parse_xml_file(xml_file).getroot()
+
+            # Find all elements with r:id attributes
+            for elem in xml_root.iter():
+                # Check for r:id attribute (relationship ID)
+                rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
+                if rid_attr:
+                    xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+                    elem_name = (
+                        elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                    )
+
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            f"  {xml_rel_path}: Line {elem.sourceline}: "
+                            f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(
+                            elem_name
+                        )
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    f"  {xml_rel_path}: Line {elem.sourceline}: "
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship"
+                                )
+
+        except Exception as e:
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+            errors.append(f"  Error processing {xml_rel_path}: {e}")
+
+        return errors
+
     def _get_expected_relationship_type(self, element_name):
         """
         Get the expected relationship type for an element.
@@ -531,7 +806,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml_file(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -592,18 +867,17 @@ class BaseSchemaValidator:
                 ):
                     continue
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
-
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
-                        )
-
-                except Exception:
+                root_name = self._cached_part_result(
+                    "root_name", xml_file, self._get_root_name
+                )
+                if root_name is None:
                     continue  # Skip unparseable files
 
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    errors.append(
+                        f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                    )
+
             # Check all non-XML files for Default extension declarations
             for file_path in all_files:
                 # Skip XML files and metadata files (already checked above)
@@ -638,6 +912,14 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _get_root_name(self, xml_file):
+        """Return the local name of a file's root element, or None if unparseable."""
+        try:
+            root_tag = self._parse_xml_file(xml_file).getroot().tag
+        except Exception:
+            return None
+        return root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
@@ -673,7 +955,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +974,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.xml_files, self._validate_files_against_xsd()
+        ):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,7 +993,7 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -738,6 +1019,57 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self):
+        """Return validate_file_against_xsd results for self.xml_files, in order.
+
+        In incremental mode, unchanged parts reuse their previous result. With
+        jobs > 1 the remaining parts are fanned out across a process pool;
+        results are still returned in self.xml_files order so output is
+        deterministic.
+        """
+        results = {}
+        pending = []
+        for xml_file in self.xml_files:
+            if self.incremental:
+                digest, result = self._lookup_part_result("xsd", xml_file)
+                if result is not _MISSING:
+                    is_valid, new_file_errors = result
+                    results[xml_file] = (is_valid, set(new_file_errors))
+                    self._store_part_result("xsd", xml_file, digest, result)
+                    continue
+            pending.append(xml_file)
+
+        if self.jobs <= 1 or len(pending) <= 1:
+            computed = (
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in pending
+            )
+        else:
+            chunksize = max(1, len(pending) // (self.jobs * 4))
+            executor = ProcessPoolExecutor(max_workers=self.jobs)
+            computed = executor.map(
+                _validate_file_against_xsd_in_worker,
+                repeat(type(self)),
+                repeat(self.unpacked_dir),
+                repeat(self.original_file),
+                pending,
+                chunksize=chunksize,
+            )
+
+        try:
+            for xml_file, (is_valid, new_file_errors) in zip(pending, computed):
+                results[xml_file] = (is_valid, new_file_errors)
+                if self.incremental:
+                    digest, _ = self._lookup_part_result("xsd", xml_file)
+                    self._store_part_result(
+                        "xsd", xml_file, digest, [is_valid, sorted(new_file_errors)]
+                    )
+        finally:
+            if self.jobs > 1 and len(pending) > 1:
+                executor.shutdown()
+
+        return [results[xml_file] for xml_file in self.xml_files]
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -830,78 +1162,104 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
+            # Load XML (shared parsed tree, copied before preprocessing)
+            xml_doc = self._parse_xml_file(xml_file)
+
+            return self._validate_xml_doc_xsd(
+                xml_doc, schema_path, xml_file.relative_to(base_path)
+            )
+
+        except Exception as e:
+            return False, {str(e)}
+
+    def _validate_xml_doc_xsd(self, xml_doc, schema_path, relative_path):
+        """Validate a parsed XML document against XSD schema. Returns (is_valid, errors_set)."""
+        # Load schema (compiled once per process)
+        schema = self._load_schema(schema_path)
+
+        # Preprocess XML
+        xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
+        xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+
+        # Clean ignorable namespaces if needed
+        if relative_path.parts and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS:
+            xml_doc = self._clean_ignorable_namespaces(xml_doc)
+
+        # Validate
+        if schema.validate(xml_doc):
+            return True, set()
+        else:
+            errors = set()
+            for error in schema.error_log:
+                # Store normalized error message (without line numbers for comparison)
+                errors.add(error.message)
+            return False, errors
+
+    def _load_schema(self, schema_path):
+        """Return the compiled XMLSchema for schema_path, compiling it on first use."""
+        cache_key = str(Path(schema_path).resolve())
+        schema = _SCHEMA_CACHE.get(cache_key)
+        if schema is None:
             with open(schema_path, "rb") as xsd_file:
                 parser = lxml.etree.XMLParser()
                 xsd_doc = lxml.etree.parse(
                     xsd_file, parser=parser, base_url=str(schema_path)
                 )
                 schema = lxml.etree.XMLSchema(xsd_doc)
-
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
-
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
-
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
-
-            # Validate
-            if schema.validate(xml_doc):
-                return True, set()
-            else:
-                errors = set()
-                for error in schema.error_log:
-                    # Store normalized error message (without line numbers for comparison)
-                    errors.add(error.message)
-                return False, errors
-
-        except Exception as e:
-            return False, {str(e)}
+            _SCHEMA_CACHE[cache_key] = schema
+        return schema
 
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Results are memoized per part, so the original file is only read once
+        for each part that has errors, however many checks ask for it.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        if relative_path not in self._original_file_errors:
+            self._original_file_errors[relative_path] = (
+                self._validate_original_part_xsd(relative_path)
+            )
+        return self._original_file_errors[relative_path]
+
+    def _validate_original_part_xsd(self, relative_path):
+        """Validate one part of the original file straight from the zip archive.
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        Args:
+            relative_path: Path of the part relative to the document root
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        Returns:
+            set: Set of error messages from the original part
+        """
+        import zipfile
 
-            if not original_xml_file.exists():
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return set()
+
+        with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+            try:
+                content = zip_ref.read(relative_path.as_posix())
+            except KeyError:
                 # File didn't exist in original, so no original errors
                 return set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        try:
+            xml_doc = lxml.etree.ElementTree(lxml.etree.fromstring(content))
+            _, errors = self._validate_xml_doc_xsd(xml_doc, schema_path, relative_path)
+        except Exception as e:
+            errors = {str(e)}
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
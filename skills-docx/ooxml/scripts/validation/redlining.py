@@ -2,11 +2,26 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
+import re
 import tempfile
 import zipfile
+from bisect import bisect_left
+from collections import Counter
 from pathlib import Path
 
+# Words and single whitespace or punctuation characters. Whitespace is not
+# grouped into runs, so a changed run of spaces never swallows its neighbours.
+WORD_PATTERN = re.compile(r"\w+|[^\w]")
+WORD_CHAR = re.compile(r"\w")
+
+# A replaced run of words is shown character by character only if at least
+# this share of its longer side is unchanged; otherwise whole words read better
+MIN_CHAR_MATCH_RATIO = 0.5
+
+# Myers search limit per unanchored range; beyond it the range is shown as a
+# plain replacement instead of spending quadratic time on a near-total rewrite
+MAX_EDIT_DISTANCE = 1000
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -112,7 +127,7 @@ class RedliningValidator:
             return True
 
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed word-level differences between the two texts."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,92 +142,37 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+        # Show word diff
+        word_diff = self._get_word_diff(original_text, modified_text)
+        error_parts.extend(["Differences:", "============", word_diff])
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _get_word_diff(self, original_text, modified_text):
+        """Generate a word diff of changed paragraphs with character-level precision.
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
+        Paragraphs are matched first, so unchanged ones are skipped. Each changed
+        paragraph becomes one line with [-removed-] and {+added+} markers.
+        """
+        original_paragraphs = original_text.split("\n")
+        modified_paragraphs = modified_text.split("\n")
+
+        lines = []
+        original_keys, modified_keys = _hash_keys(
+            original_paragraphs, modified_paragraphs
+        )
+        for tag, i1, i2, j1, j2 in _diff_opcodes(original_keys, modified_keys):
+            if tag == "equal":
+                continue
+            removed = original_paragraphs[i1:i2]
+            added = modified_paragraphs[j1:j2]
+            paired = min(len(removed), len(added))
+            for old, new in zip(removed, added):
+                lines.append(_word_diff_line(old, new))
+            lines.extend(f"[-{old}-]" for old in removed[paired:])
+            lines.extend(f"{{+{new}+}}" for new in added[paired:])
+
+        return "\n".join(lines)
 
     def _remove_claude_tracked_changes(self, root):
         """Remove tracked changes authored by Claude from the XML root."""
@@ -275,5 +235,268 @@ class RedliningValidator:
         return "\n".join(paragraphs)
 
 
+def _hash_keys(*sequences):
+    """Map the items of each sequence to small integers, equal for equal items.
+
+    Comparing integers keeps the diff cheap when paragraphs are long.
+    """
+    keys = {}
+    return [[keys.setdefault(item, len(keys)) for item in items] for items in sequences]
+
+
+def _word_diff_line(old, new):
+    """Render one changed paragraph with [-removed-] and {+added+} markers.
+
+    Only the text between the common prefix and suffix, widened to whole words,
+    is split into words and diffed.
+    """
+    start = _common_length(old, new)
+    while start and WORD_CHAR.match(old, start - 1):
+        start -= 1
+    end = _common_length(old[start:], new[start:], reverse=True)
+    while end and WORD_CHAR.match(old, len(old) - end):
+        end -= 1
+    old_words = WORD_PATTERN.findall(old, start, len(old) - end)
+    new_words = WORD_PATTERN.findall(new, start, len(new) - end)
+
+    segments = [("=", old[:start])]
+    for tag, i1, i2, j1, j2 in _diff_opcodes(old_words, new_words):
+        removed = "".join(old_words[i1:i2])
+        added = "".join(new_words[j1:j2])
+        if tag == "replace":
+            segments.extend(_char_segments(removed, added))
+        elif tag == "equal":
+            segments.append(("=", removed))
+        else:
+            segments.extend([("-", removed), ("+", added)])
+    segments.append(("=", old[len(old) - end :]))
+
+    # Merge neighbouring segments of the same kind, keeping removals first
+    parts = []
+    pending = {"-": [], "+": []}
+    for kind, text in segments + [("=", "")]:
+        if kind != "=":
+            pending[kind].append(text)
+            continue
+        removed, added = "".join(pending["-"]), "".join(pending["+"])
+        if removed:
+            parts.append(f"[-{removed}-]")
+        if added:
+            parts.append(f"{{+{added}+}}")
+        pending = {"-": [], "+": []}
+        parts.append(text)
+    return "".join(parts)
+
+
+def _common_length(a, b, reverse=False):
+    """Length of the common prefix (or suffix if reverse) of two strings.
+
+    Binary search over slice comparisons, which run in C, rather than a
+    character loop.
+    """
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if reverse:
+            same = a[len(a) - mid :] == b[len(b) - mid :]
+        else:
+            same = a[:mid] == b[:mid]
+        if same:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _char_segments(removed, added):
+    """Diff a replaced run of words by character when enough of it is shared."""
+    # Characters shared in any order bound the match, so most unrelated words
+    # are rejected without diffing them
+    threshold = MIN_CHAR_MATCH_RATIO * max(len(removed), len(added))
+    if sum((Counter(removed) & Counter(added)).values()) < threshold:
+        return [("-", removed), ("+", added)]
+
+    opcodes = _diff_opcodes(removed, added)
+    matched = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == "equal")
+    if matched < threshold:
+        return [("-", removed), ("+", added)]
+
+    segments = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            segments.append(("=", removed[i1:i2]))
+        else:
+            segments.extend([("-", removed[i1:i2]), ("+", added[j1:j2])])
+    return segments
+
+
+def _diff_opcodes(a, b):
+    """Diff two sequences into (tag, i1, i2, j1, j2) tuples like difflib.
+
+    Tags are "equal", "replace", "delete" and "insert".
+    """
+    opcodes = []
+    i = j = 0
+    for x, y, size in _matching_blocks(a, b) + [(len(a), len(b), 0)]:
+        if i < x and j < y:
+            opcodes.append(("replace", i, x, j, y))
+        elif i < x:
+            opcodes.append(("delete", i, x, j, y))
+        elif j < y:
+            opcodes.append(("insert", i, x, j, y))
+        if size:
+            opcodes.append(("equal", x, x + size, y, y + size))
+        i, j = x + size, y + size
+    return opcodes
+
+
+def _matching_blocks(a, b):
+    """Sorted (i, j, size) runs with a[i:i + size] == b[j:j + size].
+
+    Patience diff: common prefix and suffix first, then items unique to both
+    sides anchor the match and the gaps between anchors are diffed the same
+    way. Gaps without unique items fall back to Myers.
+    """
+    blocks = []
+    ranges = [(0, len(a), 0, len(b))]
+    while ranges:
+        alo, ahi, blo, bhi = ranges.pop()
+        start = alo
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            alo += 1
+            blo += 1
+        if alo > start:
+            blocks.append((start, blo - (alo - start), alo - start))
+        end = ahi
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+        if ahi < end:
+            blocks.append((ahi, bhi, end - ahi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        # A single item on either side matches its first occurrence on the
+        # other, as Myers would, and leaves nothing for anchors to split
+        if ahi - alo == 1:
+            if a[alo] in b[blo:bhi]:
+                blocks.append((alo, b.index(a[alo], blo, bhi), 1))
+            continue
+        if bhi - blo == 1:
+            if b[blo] in a[alo:ahi]:
+                blocks.append((a.index(b[blo], alo, ahi), blo, 1))
+            continue
+
+        anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+        if anchors:
+            for i, j in anchors:
+                if alo < i or blo < j:
+                    ranges.append((alo, i, blo, j))
+                blocks.append((i, j, 1))
+                alo, blo = i + 1, j + 1
+            ranges.append((alo, ahi, blo, bhi))
+        else:
+            blocks.extend(
+                (alo + x, blo + y, size)
+                for x, y, size in _match_myers(a[alo:ahi], b[blo:bhi])
+            )
+
+    # Join runs that continue each other across range boundaries
+    merged = []
+    for i, j, size in sorted(blocks):
+        if (
+            merged
+            and merged[-1][0] + merged[-1][2] == i
+            and merged[-1][1] + merged[-1][2] == j
+        ):
+            merged[-1] = (merged[-1][0], merged[-1][1], merged[-1][2] + size)
+        else:
+            merged.append((i, j, size))
+    return merged
+
+
+def _unique_anchors(a, b, alo, ahi, blo, bhi):
+    """Longest increasing run of items that occur exactly once on each side."""
+    a_items, b_items = a[alo:ahi], b[blo:bhi]
+    a_counts, b_counts = Counter(a_items), Counter(b_items)
+    b_indexes = {item: j for j, item in enumerate(b_items, blo)}
+
+    # Already sorted by position in a
+    candidates = [
+        (i, b_indexes[item])
+        for i, item in enumerate(a_items, alo)
+        if a_counts[item] == 1 and b_counts[item] == 1
+    ]
+
+    # Patience sorting: tails[k] ends the best run of length k + 1
+    tails, tail_js, links = [], [], {}
+    for i, j in candidates:
+        k = bisect_left(tail_js, j)
+        links[(i, j)] = tails[k - 1] if k else None
+        if k == len(tails):
+            tails.append((i, j))
+            tail_js.append(j)
+        else:
+            tails[k] = (i, j)
+            tail_js[k] = j
+
+    anchors = []
+    node = tails[-1] if tails else None
+    while node is not None:
+        anchors.append(node)
+        node = links[node]
+    return anchors[::-1]
+
+
+def _match_myers(a, b):
+    """Matching (i, j, size) runs of a and b from Myers' O(ND) shortest edit script.
+
+    Gives up (no matches, so the whole range reads as replaced) once more than
+    MAX_EDIT_DISTANCE edits would be needed.
+    """
+    n, m = len(a), len(b)
+    max_d = min(n + m, MAX_EDIT_DISTANCE)
+    offset = max_d + 1
+    # v[offset + k] is the furthest x reached on diagonal k = x - y
+    v = [0] * (2 * offset + 1)
+    trace = []
+    for d in range(max_d + 1):
+        # Keep diagonals -d - 1 .. d + 1, the ones step d reads
+        trace.append(v[offset - d - 1 : offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _backtrack_myers(trace, n, m)
+    return []
+
+
+def _backtrack_myers(trace, x, y):
+    """Walk the saved Myers frontiers back from (x, y) collecting diagonal runs."""
+    blocks = []
+    for d in range(len(trace) - 1, -1, -1):
+        frontier = trace[d]
+        k = x - y
+        # frontier[d + 1 + k] holds diagonal k
+        if k == -d or (k != d and frontier[d + k] < frontier[d + k + 2]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = frontier[d + 1 + prev_k]
+        prev_y = prev_x - prev_k
+        size = min(x - prev_x, y - prev_y)
+        if size > 0:
+            blocks.append((x - size, y - size, size))
+        x, y = prev_x, prev_y
+    return blocks[::-1]
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark for applying tracked changes with DocxXMLEditor.
+
+Builds a synthetic document.xml, then applies alternating deletions
+(suggest_deletion) and insertions (insert_before with <w:ins>) to its runs.
+For smaller sizes the run is repeated with an editor that rescans the DOM for
+every change ID, and both must assign the same IDs.
+
+Usage (from the skill directory):
+    python -m scripts.bench_tracked_changes [--sizes 100 1000 10000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from .document import DocxXMLEditor
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+
+
+class RescanningDocxXMLEditor(DocxXMLEditor):
+    """Reference editor that finds each change ID by scanning the whole DOM."""
+
+    def _get_next_change_id(self):
+        max_id = -1
+        for tag in ("w:ins", "w:del"):
+            for elem in self.dom.getElementsByTagName(tag):
+                change_id = elem.getAttribute("w:id")
+                if change_id:
+                    try:
+                        max_id = max(max_id, int(change_id))
+                    except ValueError:
+                        pass
+        return max_id + 1
+
+
+def write_document(path, paragraphs):
+    """Write a document.xml with two runs per paragraph and a few existing changes."""
+    parts = [
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NS}" xmlns:w14="{W14_NS}"><w:body>'
+    ]
+    for i in range(paragraphs):
+        parts.append(
+            f"<w:p><w:r><w:t>Paragraph {i} opening clause </w:t></w:r>"
+            f"<w:r><w:t>and closing clause.</w:t></w:r></w:p>"
+        )
+        if i % 100 == 0:
+            # Pre-existing tracked changes the allocator has to skip past
+            parts.append(
+                f'<w:p><w:ins w:id="{i}" w:author="Someone" w:date="2024-01-01T00:00:00Z">'
+                f"<w:r><w:t>Earlier insertion {i}</w:t></w:r></w:ins></w:p>"
+            )
+    parts.append("</w:body></w:document>")
+    Path(path).write_text("".join(parts), encoding="utf-8")
+
+
+def apply_changes(editor_class, xml_path, count):
+    """Apply count tracked changes; return (seconds, assigned change IDs)."""
+    editor = editor_class(xml_path, rsid="00C0FFEE", author="Benchmark")
+    runs = [
+        run
+        for run in editor.dom.getElementsByTagName("w:r")
+        if run.parentNode.tagName == "w:p"
+    ][:count]
+
+    ids = []
+    start = time.perf_counter()
+    for i, run in enumerate(runs):
+        if i % 2 == 0:
+            change = editor.suggest_deletion(run)
+        else:
+            change = editor.insert_before(
+                run, f"<w:ins><w:r><w:t>inserted {i}</w:t></w:r></w:ins>"
+            )[0]
+        ids.append(change.getAttribute("w:id"))
+    elapsed = time.perf_counter() - start
+    return elapsed, ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tracked change IDs")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="Tracked changes to apply (default: 100 1000 10000)",
+    )
+    parser.add_argument(
+        "--rescan-limit",
+        type=int,
+        default=1000,
+        help="Largest size also run with the rescanning editor (default: 1000)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'changes':>8} {'rescan':>10} {'allocator':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in args.sizes:
+            xml_path = Path(temp_dir) / f"document-{count}.xml"
+            # One paragraph holds two runs, so this leaves runs to spare
+            write_document(xml_path, count)
+
+            alloc_time, ids = apply_changes(DocxXMLEditor, xml_path, count)
+            assert len(set(ids)) == len(ids), f"Duplicate IDs for {count} changes"
+
+            if count <= args.rescan_limit:
+                rescan_time, expected = apply_changes(
+                    RescanningDocxXMLEditor, xml_path, count
+                )
+                assert ids == expected, f"Change IDs differ for {count} changes"
+                print(
+                    f"{count:>8} {rescan_time:>9.3f}s {alloc_time:>9.3f}s "
+                    f"{rescan_time / max(alloc_time, 1e-9):>7.1f}x"
+                )
+            else:
+                print(f"{count:>8} {'-':>10} {alloc_time:>9.3f}s {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
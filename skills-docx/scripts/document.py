@@ -26,7 +26,9 @@ Usage:
     doc.save()
 """
 
+import copy
 import html
+import os
 import random
 import shutil
 import tempfile
@@ -38,7 +40,7 @@ from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor, _join_text
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -71,20 +73,33 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        # Next free tracked change ID, seeded from the DOM on first use
+        self._next_change_id = None
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next tracked change ID.
+
+        The DOM is scanned for the highest w:ins/w:del ID only once; after that
+        IDs are handed out in sequence, skipping past any explicit IDs in
+        inserted content (see _reserve_change_ids).
+        """
+        if self._next_change_id is None:
+            self._next_change_id = 0
+            for tag in ("w:ins", "w:del"):
+                self._reserve_change_ids(self.dom.getElementsByTagName(tag))
+        change_id = self._next_change_id
+        self._next_change_id += 1
+        return change_id
+
+    def _reserve_change_ids(self, elements):
+        """Make sure the allocator never hands out IDs already used by elements."""
+        for elem in elements:
+            change_id = elem.getAttribute("w:id")
+            if change_id:
+                try:
+                    self._next_change_id = max(self._next_change_id, int(change_id) + 1)
+                except ValueError:
+                    pass
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
@@ -134,7 +149,7 @@ class DocxXMLEditor(XMLEditor):
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
             parent = elem.parentNode
-            while parent:
+            while parent is not None:
                 if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
                     return True
                 parent = parent.parentNode
@@ -195,15 +210,25 @@ class DocxXMLEditor(XMLEditor):
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
+            text = self._first_text(elem)
+            if text is not None:
                 if text and (text[0].isspace() or text[-1].isspace()):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        # Re-file the nodes in the lookup indexes under their new attribute values
+        self._update_indexes(removed=nodes)
+
+        # Explicit IDs in the new content must not be allocated again
+        if self._next_change_id is not None:
+            for node in nodes:
+                if node.nodeType != node.ELEMENT_NODE:
+                    continue
+                if node.tagName in ("w:ins", "w:del"):
+                    self._reserve_change_ids([node])
+                for tag in ("w:ins", "w:del"):
+                    self._reserve_change_ids(node.getElementsByTagName(tag))
+
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
@@ -237,6 +262,8 @@ class DocxXMLEditor(XMLEditor):
             for elem in node.getElementsByTagName("w16cex:commentExtensible"):
                 add_comment_extensible_date(elem)
 
+        self._update_indexes(added=nodes)
+
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
         nodes = super().replace_node(elem, new_content)
@@ -299,6 +326,8 @@ class DocxXMLEditor(XMLEditor):
                 f"The provided element <{elem.tagName}> contains no insertions. "
             )
 
+        self._update_indexes(removed=[elem])
+
         # Process all insertions - wrap all children in w:del
         for ins_elem in ins_elements:
             runs = list(ins_elem.getElementsByTagName("w:r"))
@@ -337,6 +366,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+        self._update_indexes(added=[elem])
         return [elem]
 
     def revert_deletion(self, elem):
@@ -500,6 +530,8 @@ class DocxXMLEditor(XMLEditor):
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
 
+            self._update_indexes(removed=[elem])
+
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
                 del_text = self.dom.createElement("w:delText")
@@ -529,6 +561,7 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            self._update_indexes(added=[del_wrapper])
             return del_wrapper
 
         elif elem.nodeName == "w:p":
@@ -536,6 +569,8 @@ class DocxXMLEditor(XMLEditor):
             if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
                 raise ValueError("w:p element already contains tracked changes")
 
+            self._update_indexes(removed=[elem])
+
             # Check if it's a numbered list item
             pPr_list = elem.getElementsByTagName("w:pPr")
             is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
@@ -587,12 +622,229 @@ class DocxXMLEditor(XMLEditor):
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+            self._update_indexes(added=[elem])
             return elem
 
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(DocxXMLEditor, LxmlXMLEditor):
+    """DocxXMLEditor on the lxml backend (see LxmlXMLEditor).
+
+    Attribute injection and lookups are shared with DocxXMLEditor; the
+    tracked change helpers are reimplemented with lxml, where renaming
+    w:t to w:delText keeps its text and attributes in place.
+    """
+
+    def _new_element(self, near, tag):
+        """Create a detached element; near provides the namespaces."""
+        return near.makeelement(near._qualify_tag(tag))
+
+    def _mark_run_deleted(self, run):
+        """Convert a run's w:t to w:delText and w:rsidR to w:rsidDel."""
+        if run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+            run.removeAttribute("w:rsidR")
+        elif not run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidDel", self.rsid)
+        for t_elem in run.getElementsByTagName("w:t"):
+            # Renamed in place, so move it between the indexes of both tags
+            self._update_indexes(removed=[t_elem])
+            t_elem.tag = t_elem._qualify_tag("w:delText")
+            self._update_indexes(added=[t_elem])
+
+    def _wrap_children(self, elem, wrapper, keep=()):
+        """Move an element's content (except tags in keep) into wrapper, then append it.
+
+        Text moves too, including the tails of kept elements, as minidom text
+        nodes would.
+        """
+        wrapper.text, elem.text = elem.text, None
+        for child in list(elem):
+            if getattr(child, "tagName", None) not in keep:
+                wrapper.append(child)
+                continue
+            text, child.tail = child.tail, None
+            if len(wrapper):
+                wrapper[-1].tail = _join_text(wrapper[-1].tail, text)
+            else:
+                wrapper.text = _join_text(wrapper.text, text)
+        elem.append(wrapper)
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion.
+        """
+        if elem.tagName == "w:ins":
+            ins_elements = [elem]
+        else:
+            ins_elements = elem.getElementsByTagName("w:ins")
+
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{elem.tagName}> contains no insertions. "
+            )
+
+        self._update_indexes(removed=[elem])
+        for ins_elem in ins_elements:
+            runs = ins_elem.getElementsByTagName("w:r")
+            if not runs:
+                continue
+            for run in runs:
+                self._mark_run_deleted(run)
+            del_wrapper = self._new_element(ins_elem, "w:del")
+            self._wrap_children(ins_elem, del_wrapper)
+            self._inject_attributes_to_nodes([del_wrapper])
+
+        self._update_indexes(added=[elem])
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion.
+        """
+        is_single_del = elem.tagName == "w:del"
+        if is_single_del:
+            del_elements = [elem]
+        else:
+            del_elements = elem.getElementsByTagName("w:del")
+
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{elem.tagName}> contains no deletions. "
+            )
+
+        created_insertion = None
+        for del_elem in del_elements:
+            runs = del_elem.getElementsByTagName("w:r")
+            if not runs:
+                continue
+
+            ins_elem = self._new_element(del_elem, "w:ins")
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                new_run.tail = None
+                for copied in new_run.iter():
+                    # Copies are new content, without a line in the original file
+                    copied.sourceline = 0
+                # Not indexed yet: the copy is indexed with ins_elem below
+                for del_text in new_run.getElementsByTagName("w:delText"):
+                    del_text.tag = del_text._qualify_tag("w:t")
+                if new_run.hasAttribute("w:rsidDel"):
+                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
+                    new_run.removeAttribute("w:rsidDel")
+                elif not new_run.hasAttribute("w:rsidR"):
+                    new_run.setAttribute("w:rsidR", self.rsid)
+                ins_elem.append(new_run)
+
+            del_elem.addnext(ins_elem)
+            self._update_indexes(added=[ins_elem])
+            self._inject_attributes_to_nodes([ins_elem])
+            if is_single_del:
+                created_insertion = ins_elem
+
+        if is_single_del and created_insertion is not None:
+            return [elem, created_insertion]
+        return [elem]
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion.
+        """
+        if elem.tagName == "w:r":
+            if elem.getElementsByTagName("w:delText"):
+                raise ValueError("w:r element already contains w:delText")
+
+            self._update_indexes(removed=[elem])
+            self._mark_run_deleted(elem)
+
+            # Wrap in w:del, which takes over the run's tail
+            del_wrapper = self._new_element(elem, "w:del")
+            elem.addprevious(del_wrapper)
+            del_wrapper.tail, elem.tail = elem.tail, None
+            del_wrapper.append(elem)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            self._update_indexes(added=[del_wrapper])
+            return del_wrapper
+
+        elif elem.tagName == "w:p":
+            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
+                raise ValueError("w:p element already contains tracked changes")
+
+            self._update_indexes(removed=[elem])
+
+            # Numbered list items also get <w:del/> in the paragraph mark's w:rPr
+            pPr_list = elem.getElementsByTagName("w:pPr")
+            if pPr_list and pPr_list[0].getElementsByTagName("w:numPr"):
+                pPr = pPr_list[0]
+                rPr_list = pPr.getElementsByTagName("w:rPr")
+                if rPr_list:
+                    rPr = rPr_list[0]
+                else:
+                    rPr = self._new_element(pPr, "w:rPr")
+                    pPr.append(rPr)
+                rPr.insert(0, self._new_element(rPr, "w:del"))
+
+            for run in elem.getElementsByTagName("w:r"):
+                self._mark_run_deleted(run)
+
+            del_wrapper = self._new_element(elem, "w:del")
+            self._wrap_children(elem, del_wrapper, keep=("w:pPr",))
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            self._update_indexes(added=[elem])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {elem.tagName}")
+
+
+# Editor classes for the backends Document can use
+EDITOR_BACKENDS = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
+
+
+def _link_tree(sources, dest, exclude=(), rebuild=True):
+    """Build dest from the files of each source directory, later sources winning.
+
+    Files are hard-linked where possible so large media is not copied. Across
+    filesystems, XML parts are copied and all other files are symlinked, so dest
+    must only be read. Paths in exclude (relative) are left out. With
+    rebuild=False the files are linked into the existing dest instead.
+    """
+    dest = Path(dest)
+    if rebuild and dest.exists():
+        shutil.rmtree(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    for source in sources:
+        source = Path(source)
+        for file_path in source.rglob("*"):
+            relative_path = file_path.relative_to(source)
+            if not file_path.is_file() or relative_path in exclude:
+                continue
+            target = dest / relative_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Unlink first so a later source never writes through an earlier link
+            target.unlink(missing_ok=True)
+            try:
+                os.link(file_path, target)
+            except OSError:
+                if file_path.name.endswith((".xml", ".rels")):
+                    shutil.copy2(file_path, target)
+                    continue
+                try:
+                    os.symlink(file_path.resolve(), target)
+                except OSError:
+                    shutil.copy2(file_path, target)
+    return dest
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -619,10 +871,12 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
         Automatically sets up comment infrastructure (people.xml, RSIDs).
+        Only parts opened for editing are copied to the temporary directory.
 
         Args:
             unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
@@ -630,20 +884,33 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: XML engine for the editors, "minidom" (default) or "lxml".
+                     lxml loads and saves large documents several times faster;
+                     its nodes support the same minidom-style calls the editors use.
         """
+        if backend not in EDITOR_BACKENDS:
+            raise ValueError(
+                f"Unknown backend: {backend} (expected one of {', '.join(EDITOR_BACKENDS)})"
+            )
+        self.backend = backend
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory for edited parts. It starts empty: parts are
+        # copied in from the original directory when first opened for editing,
+        # and everything else is read from the original until save()/validate()
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self.unpacked_path.mkdir()
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # The validation baseline (original.docx) is packed on first validate()
+        self._original_docx = None
+        # Original versions of parts overwritten by saving back in place before
+        # the baseline was built, and parts that the original did not have
+        self._baseline_stash = Path(self.temp_dir) / "baseline"
+        self._baseline_added = set()
 
         self.word_path = self.unpacked_path / "word"
 
@@ -701,11 +968,12 @@ class Document:
             comment = doc["word/comments.xml"].get_node(tag="w:comment", attrs={"w:id": "0"})
         """
         if xml_path not in self._editors:
-            file_path = self.unpacked_path / xml_path
+            file_path = self._materialize(xml_path)
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            editor_class = EDITOR_BACKENDS[self.backend]
+            self._editors[xml_path] = editor_class(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
         return self._editors[xml_path]
@@ -842,12 +1110,20 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
+        # Create validators with current state: edited parts over the original
+        # directory, linked into one tree rather than copied. Only parts in the
+        # temp directory change while the document is open, so later runs just
+        # relink those.
+        merged_path = Path(self.temp_dir) / "merged"
+        if merged_path.exists():
+            _link_tree([self.unpacked_path], merged_path, rebuild=False)
+        else:
+            _link_tree([self.original_path, self.unpacked_path], merged_path)
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            merged_path, self.original_docx, verbose=False
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            merged_path, self.original_docx, verbose=False
         )
 
         # Run validations
@@ -867,7 +1143,7 @@ class Document:
             validate: If True, validates document before saving (default: True).
         """
         # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        if self._part_exists(self.comments_path):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
@@ -879,15 +1155,77 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy edited parts to destination (or original directory); a new
+        # destination also gets every part that was never edited
         target_path = Path(destination) if destination else self.original_path
+        in_place = target_path.resolve() == self.original_path.resolve()
+        if not in_place:
+            shutil.copytree(self.original_path, target_path, dirs_exist_ok=True)
+        elif self._original_docx is None:
+            self._stash_baseline_parts()
         shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
 
+    @property
+    def original_docx(self):
+        """Path to the original document packed as .docx, built on first use."""
+        if self._original_docx is None:
+            original_docx = Path(self.temp_dir) / "original.docx"
+            source = self.original_path
+            if self._baseline_added or self._baseline_stash.exists():
+                # Saved in place already, so restore the parts it overwrote
+                source = _link_tree(
+                    [self.original_path, self._baseline_stash],
+                    Path(self.temp_dir) / "baseline_tree",
+                    exclude=self._baseline_added,
+                )
+            pack_document(source, original_docx, validate=False)
+            self._original_docx = original_docx
+        return self._original_docx
+
+    # ==================== Private: Copy-on-write Parts ====================
+
+    def _materialize(self, xml_path):
+        """Copy a part from the original directory into the temp directory.
+
+        Returns the part's path in the temp directory, which does not exist if
+        the original directory has no such part either.
+        """
+        file_path = self.unpacked_path / xml_path
+        source = self.original_path / xml_path
+        if not file_path.exists() and source.is_file():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, file_path)
+        return file_path
+
+    def _part_exists(self, path):
+        """Check whether a temp directory path exists there or in the original."""
+        relative_path = Path(path).relative_to(self.unpacked_path)
+        return path.exists() or (self.original_path / relative_path).exists()
+
+    def _add_part_from_template(self, path):
+        """Create a part in the temp directory from the template of the same name."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(TEMPLATE_DIR / path.name, path)
+
+    def _stash_baseline_parts(self):
+        """Keep the original versions of the parts save() is about to overwrite."""
+        for file_path in self.unpacked_path.rglob("*"):
+            if not file_path.is_file():
+                continue
+            relative_path = file_path.relative_to(self.unpacked_path)
+            source = self.original_path / relative_path
+            stashed = self._baseline_stash / relative_path
+            if not source.is_file():
+                self._baseline_added.add(relative_path)
+            elif not stashed.exists() and relative_path not in self._baseline_added:
+                stashed.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, stashed)
+
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
-        if not self.comments_path.exists():
+        if not self._part_exists(self.comments_path):
             return 0
 
         editor = self["word/comments.xml"]
@@ -903,7 +1241,7 @@ class Document:
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._part_exists(self.comments_path):
             return {}
 
         editor = self["word/comments.xml"]
@@ -953,9 +1291,9 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
+        if not self._part_exists(path):
             # Copy from template
-            shutil.copy(TEMPLATE_DIR / "people.xml", path)
+            self._add_part_from_template(path)
 
     def _add_content_type_for_people(self, path):
         """Add people.xml content type to [Content_Types].xml if not already present."""
@@ -1069,8 +1407,8 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+        if not self._part_exists(self.comments_path):
+            self._add_part_from_template(self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
@@ -1090,10 +1428,8 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
+        if not self._part_exists(self.comments_extended_path):
+            self._add_part_from_template(self.comments_extended_path)
 
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
@@ -1106,8 +1442,8 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+        if not self._part_exists(self.comments_ids_path):
+            self._add_part_from_template(self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
@@ -1117,10 +1453,8 @@ class Document:
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
+        if not self._part_exists(self.comments_extensible_path):
+            self._add_part_from_template(self.comments_extensible_path)
 
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
@@ -1183,7 +1517,7 @@ class Document:
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._part_exists(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
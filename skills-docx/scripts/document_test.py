@@ -0,0 +1,93 @@
+"""
+Tests for node lookups after tracked changes rename w:t and w:delText.
+
+Run from the skill directory:
+    python -m unittest scripts.document_test
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from .document import DocxXMLEditor, LxmlDocxXMLEditor
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# One element per line, so "Paragraph 3 has" starts on a known line
+DOCUMENT_XML = "\n".join(
+    [
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>',
+        f'<w:document xmlns:w="{W_NS}">',
+        "<w:body>",
+        *(
+            f"<w:p>\n<w:r>\n<w:t>Paragraph {i} has some text</w:t>\n</w:r>\n</w:p>"
+            for i in range(1, 6)
+        ),
+        "</w:body>",
+        "</w:document>",
+    ]
+)
+
+
+class LookupAfterTrackedChangesTest(unittest.TestCase):
+    editor_class = DocxXMLEditor
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        xml_path = Path(self.temp_dir.name) / "document.xml"
+        xml_path.write_text(DOCUMENT_XML, encoding="utf-8")
+        self.editor = self.editor_class(xml_path, rsid="00AB12CD", author="Tester")
+        self.t_line = (
+            DOCUMENT_XML.splitlines().index("<w:t>Paragraph 3 has some text</w:t>") + 1
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def delete_paragraph_3_run(self):
+        run = self.editor.get_node(tag="w:r", contains="Paragraph 3 has")
+        return self.editor.suggest_deletion(run)
+
+    def test_deleted_text_is_not_found_as_w_t(self):
+        # Build the line and text indexes before the edit
+        self.editor.get_node(tag="w:t", line_number=self.t_line)
+        self.editor.get_node(tag="w:t", contains="Paragraph 3 has")
+
+        self.delete_paragraph_3_run()
+
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:t", line_number=self.t_line)
+        with self.assertRaisesRegex(ValueError, "Node not found"):
+            self.editor.get_node(tag="w:t", contains="Paragraph 3 has")
+        del_text = self.editor.get_node(tag="w:delText", contains="Paragraph 3 has")
+        self.assertEqual(del_text.tagName, "w:delText")
+
+    def test_reverted_deletion_is_found_once_per_tag(self):
+        deletion = self.delete_paragraph_3_run()
+        self.editor.get_node(tag="w:delText", contains="Paragraph 3 has")
+
+        self.editor.revert_deletion(deletion)
+
+        t_elem = self.editor.get_node(tag="w:t", contains="Paragraph 3 has")
+        self.assertEqual(t_elem.tagName, "w:t")
+        self.assertEqual(t_elem.parentNode.parentNode.tagName, "w:ins")
+        del_text = self.editor.get_node(tag="w:delText", contains="Paragraph 3 has")
+        self.assertEqual(del_text.parentNode.parentNode.tagName, "w:del")
+
+    def test_ambiguous_lookup_after_deletion_raises(self):
+        self.delete_paragraph_3_run()
+        # Index w:delText while it has a single element
+        self.editor.get_node(tag="w:delText", contains="Paragraph 3 has")
+        run = self.editor.get_node(tag="w:r", contains="Paragraph 4 has")
+        self.editor.suggest_deletion(run)
+
+        with self.assertRaisesRegex(ValueError, "Multiple nodes found"):
+            self.editor.get_node(tag="w:delText", contains="has some text")
+
+
+class LxmlLookupAfterTrackedChangesTest(LookupAfterTrackedChangesTest):
+    editor_class = LxmlDocxXMLEditor
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,14 +7,28 @@ Example usage:
 """
 
 import argparse
-import shutil
+import io
+import os
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import xml.sax.handler
+import defusedxml.sax
 import zipfile
 from pathlib import Path
 
+try:
+    from . import soffice_pool
+except ImportError:  # Run as a script rather than imported from the package
+    import soffice_pool
+
+# Parts that are condensed before packing (matched on the name so that
+# _rels/.rels is included)
+XML_SUFFIXES = (".xml", ".rels")
+
+# Media that is already compressed, so deflating it again only costs time
+STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".emz", ".wmz"}
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -61,28 +75,34 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # List the parts before the archive exists, so an output file inside
+    # input_dir is never packed into itself
+    output_path = output_file.resolve()
+    parts = [
+        f for f in input_dir.rglob("*") if f.is_file() and f.resolve() != output_path
+    ]
+
+    # Stream parts straight into the archive, reading each file once and never
+    # modifying the input directory
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        for f in parts:
+            arcname = f.relative_to(input_dir).as_posix()
+
+            if f.name.endswith(XML_SUFFIXES):
+                # Remove pretty-printing whitespace
+                with open(f, "rb") as source, zf.open(arcname, "w") as target:
+                    condense_xml_stream(source, target)
+            elif f.suffix.lower() in STORED_SUFFIXES:
+                zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(f, arcname)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
@@ -99,6 +119,14 @@ def validate_document(doc_path):
             filter_name = "html:HTML (StarCalc)"
 
     with tempfile.TemporaryDirectory() as temp_dir:
+        # Use a warm soffice from the pool when one is running
+        if soffice_pool.is_running():
+            response = soffice_pool.convert(doc_path, filter_name, temp_dir, timeout=10)
+            if not response["ok"]:
+                print(f"Validation error: {response['error']}", file=sys.stderr)
+                return False
+            return True
+
         try:
             result = subprocess.run(
                 [
@@ -131,28 +159,151 @@ def validate_document(doc_path):
 
 
 def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    """Strip unnecessary whitespace and remove comments from an XML file in place."""
+    xml_file = Path(xml_file)
+    temp_file = xml_file.with_name(xml_file.name + ".part")
+    with open(xml_file, "rb") as source, open(temp_file, "wb") as target:
+        condense_xml_stream(source, target)
+    os.replace(temp_file, xml_file)
+
+
+def condense_xml_bytes(data):
+    """Strip unnecessary whitespace and remove comments from XML content.
+
+    Args:
+        data: XML content as bytes
+
+    Returns:
+        bytes: Condensed XML, UTF-8 encoded
+    """
+    target = io.BytesIO()
+    condense_xml_stream(io.BytesIO(data), target)
+    return target.getvalue()
+
+
+def condense_xml_stream(source, target):
+    """Condense XML read from a binary file object into another one.
+
+    The document is streamed through a SAX parser instead of being loaded into
+    a DOM, and output is written as it is produced, so memory stays bounded by
+    the parser's read buffer and the longest text node. Whitespace-only text
+    and comments are dropped except inside *:t elements, and the output
+    matches what minidom's toxml() produces.
+
+    Args:
+        source: Binary file object with the XML content
+        target: Binary file object receiving UTF-8 encoded condensed XML
+    """
+    # Keep the caller's file open after the wrapper is done with it
+    writer = io.TextIOWrapper(target, encoding="utf-8", newline="", write_through=False)
+    try:
+        handler = _CondensingHandler(writer.write)
+        parser = defusedxml.sax.make_parser()
+        parser.setContentHandler(handler)
+        parser.setProperty(xml.sax.handler.property_lexical_handler, handler)
+        parser.parse(source)
+        writer.flush()
+    finally:
+        writer.detach()
+
+
+def _escape(data):
+    """Escape text or attribute values the way minidom does."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+class _CondensingHandler(
+    xml.sax.handler.ContentHandler, xml.sax.handler.LexicalHandler
+):
+    """SAX handler that writes condensed XML as it parses."""
+
+    def __init__(self, write):
+        super().__init__()
+        # Text sink for the condensed document
+        self.write = write
+        self.write('<?xml version="1.0" encoding="UTF-8"?>')
+        # Names of the open elements
+        self.stack = []
+        # Whether the innermost element's start tag is still waiting for ">"
+        self.start_tag_open = False
+        # Character data seen since the last event, merged like minidom does
+        self.text = []
+        self.in_cdata = False
+
+    def _keeps_everything(self):
+        """Return True if children of the current node are never stripped."""
+        return not self.stack or self.stack[-1].endswith(":t")
+
+    def _close_start_tag(self):
+        if self.start_tag_open:
+            self.write(">")
+            self.start_tag_open = False
+
+    def _flush_text(self):
+        if not self.text:
+            return
+        text = "".join(self.text)
+        self.text = []
+        if text.strip() == "" and not self._keeps_everything():
+            return
+        self._close_start_tag()
+        self.write(_escape(text))
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        self._close_start_tag()
+        self.write(f"<{name}")
+
+        # minidom puts namespace declarations before the other attributes
+        names = attrs.getNames()
+        for attr_name in sorted(
+            names, key=lambda n: not (n == "xmlns" or n.startswith("xmlns:"))
+        ):
+            self.write(f' {attr_name}="{_escape(attrs[attr_name])}"')
+
+        self.stack.append(name)
+        self.start_tag_open = True
+
+    def endElement(self, name):
+        self._flush_text()
+        self.stack.pop()
+        if self.start_tag_open:
+            self.write("/>")
+            self.start_tag_open = False
+        else:
+            self.write(f"</{name}>")
+
+    def characters(self, content):
+        if self.in_cdata:
+            self.write(content)
+        else:
+            self.text.append(content)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._close_start_tag()
+        self.write(f"<?{target} {data}?>")
+
+    def comment(self, content):
+        self._flush_text()
+        if self._keeps_everything():
+            self._close_start_tag()
+            self.write(f"<!--{content}-->")
+
+    def startCDATA(self):
+        self._flush_text()
+        self._close_start_tag()
+        self.write("<![CDATA[")
+        self.in_cdata = True
+
+    def endCDATA(self):
+        self.write("]]>")
+        self.in_cdata = False
 
 
 if __name__ == "__main__":
@@ -3,14 +3,19 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--incremental]
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
 
 
 def main():
@@ -30,6 +35,18 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for per-part XSD validation (default: 1)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-check parts that changed since the last --incremental run",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -41,6 +58,7 @@ def main():
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
+    assert args.jobs >= 1, "Error: --jobs must be at least 1"
 
     # Run validations
     match file_extension:
@@ -55,7 +73,16 @@ def main():
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        if issubclass(V, BaseSchemaValidator):
+            validator = V(
+                unpacked_dir,
+                original_file,
+                verbose=args.verbose,
+                jobs=args.jobs,
+                incremental=args.incremental,
+            )
+        else:
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
         if not validator.validate():
             success = False
 
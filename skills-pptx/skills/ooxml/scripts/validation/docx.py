@@ -3,7 +3,6 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
 import zipfile
 
 import lxml.etree
@@ -25,6 +24,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
         if not self.validate_xml():
+            self._save_manifest()
             return False
 
         # Test 1: Namespace declarations
@@ -67,6 +67,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         # Count and compare paragraphs
         self.compare_paragraph_counts()
 
+        self._save_manifest()
         return all_valid
 
     def validate_whitespace_preservation(self):
@@ -80,36 +81,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_result(
+                    "whitespace", xml_file, self._check_whitespace_part
                 )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -121,6 +97,41 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    def _check_whitespace_part(self, xml_file):
+        """Return whitespace preservation errors for a single XML file."""
+        errors = []
+        try:
+            root = self._parse_xml_file(xml_file).getroot()
+
+            # Find all w:t elements
+            for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
+                if elem.text:
+                    text = elem.text
+                    # Check if text starts or ends with whitespace
+                    if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+                        # Check if xml:space="preserve" attribute exists
+                        xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
+                        if (
+                            xml_space_attr not in elem.attrib
+                            or elem.attrib[xml_space_attr] != "preserve"
+                        ):
+                            # Show a preview of the text
+                            text_preview = (
+                                repr(text)[:50] + "..."
+                                if len(repr(text)) > 50
+                                else repr(text)
+                            )
+                            errors.append(
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                            )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
@@ -133,32 +144,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_result(
+                    "deletions", xml_file, self._check_deletions_part
                 )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -170,6 +160,37 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:t elements found within w:del elements")
             return True
 
+    def _check_deletions_part(self, xml_file):
+        """Return w:t within w:del errors for a single XML file."""
+        errors = []
+        try:
+            root = self._parse_xml_file(xml_file).getroot()
+
+            # Find all w:t elements that are descendants of w:del elements
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+            xpath_expression = ".//w:del//w:t"
+            problematic_t_elements = root.xpath(
+                xpath_expression, namespaces=namespaces
+            )
+            for t_elem in problematic_t_elements:
+                if t_elem.text:
+                    # Show a preview of the text
+                    text_preview = (
+                        repr(t_elem.text)[:50] + "..."
+                        if len(repr(t_elem.text)) > 50
+                        else repr(t_elem.text)
+                    )
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
+                    )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
     def count_paragraphs_in_unpacked(self):
         """Count the number of paragraphs in the unpacked document."""
         count = 0
@@ -179,34 +200,44 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
+            part_count, error = self._cached_part_result(
+                "paragraph_count", xml_file, self._count_paragraphs_part
+            )
+            if error is None:
+                count = part_count
+            else:
+                print(f"Error counting paragraphs in unpacked document: {error}")
 
         return count
 
+    def _count_paragraphs_part(self, xml_file):
+        """Return [paragraph count, error message or None] for a single XML file."""
+        try:
+            root = self._parse_xml_file(xml_file).getroot()
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            return [len(paragraphs), None]
+        except Exception as e:
+            return [0, str(e)]
+
     def count_paragraphs_in_original(self):
         """Count the number of paragraphs in the original docx file."""
+        return self._cached_original_result(
+            "paragraph_count", self._count_paragraphs_in_original_file
+        )
+
+    def _count_paragraphs_in_original_file(self):
+        """Count w:p elements in the original's word/document.xml."""
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
+            # Read document.xml straight from the original docx
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                root = lxml.etree.fromstring(zip_ref.read("word/document.xml"))
 
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -224,31 +255,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_result(
+                    "insertions", xml_file, self._check_insertions_part
                 )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
@@ -260,6 +271,36 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:delText elements within w:ins elements")
             return True
 
+    def _check_insertions_part(self, xml_file):
+        """Return w:delText within w:ins errors for a single XML file."""
+        errors = []
+        try:
+            root = self._parse_xml_file(xml_file).getroot()
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+
+            # Find w:delText in w:ins that are NOT within w:del
+            invalid_elements = root.xpath(
+                ".//w:ins//w:delText[not(ancestor::w:del)]",
+                namespaces=namespaces
+            )
+
+            for elem in invalid_elements:
+                text_preview = (
+                    repr(elem.text or "")[:50] + "..."
+                    if len(repr(elem.text or "")) > 50
+                    else repr(elem.text or "")
+                )
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
+                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
         original_count = self.count_paragraphs_in_original()
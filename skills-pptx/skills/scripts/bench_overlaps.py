@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for overlap detection in inventory.py.
+
+Builds synthetic slides of random, stacked or grid layouts, runs
+detect_overlaps on them and compares the result and timing with a plain
+pairwise comparison of every two shapes.
+
+Usage:
+    python bench_overlaps.py [--sizes 10 100 1000 5000] [--layouts random stacked grid] [--seed N]
+"""
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from inventory import calculate_overlap, detect_overlaps
+
+SLIDE_WIDTH = 13.33  # Slide width in inches (16:9)
+SLIDE_HEIGHT = 7.5  # Slide height in inches
+
+
+def make_shapes(count, rng, layout="random"):
+    """Create shape stand-ins with the attributes detect_overlaps reads.
+
+    Layouts:
+        random: shapes scattered over the slide; sizes shrink as the count
+            grows, so large slides look like dense dashboards rather than a
+            pile of full-slide boxes
+        stacked: full-width rows one below the other, touching but not
+            overlapping, with every tenth row nudged into the next one
+        grid: equal cells in rows and columns sharing their x and y ranges,
+            with every tenth cell slightly too wide
+    """
+    rects = []
+    if layout == "stacked":
+        height = SLIDE_HEIGHT / count
+        for i in range(count):
+            nudge = height / 2 if i % 10 == 9 else 0
+            rects.append((0.0, i * height, SLIDE_WIDTH, height + nudge))
+    elif layout == "grid":
+        columns = max(1, round(count**0.5))
+        rows = -(-count // columns)
+        width, height = SLIDE_WIDTH / columns, SLIDE_HEIGHT / rows
+        for i in range(count):
+            row, column = divmod(i, columns)
+            extra = width / 2 if i % 10 == 9 else 0
+            rects.append((column * width, row * height, width + extra, height))
+    else:
+        scale = max(0.05, min(1.0, 10 / count**0.5))
+        for i in range(count):
+            width = rng.uniform(0.2, 3.0) * scale
+            height = rng.uniform(0.2, 1.5) * scale
+            left = rng.uniform(0, SLIDE_WIDTH - width)
+            top = rng.uniform(0, SLIDE_HEIGHT - height)
+            rects.append((left, top, width, height))
+
+    return [
+        SimpleNamespace(
+            shape_id=f"shape-{i}",
+            left=left,
+            top=top,
+            width=width,
+            height=height,
+            overlapping_shapes={},
+        )
+        for i, (left, top, width, height) in enumerate(rects)
+    ]
+
+
+def detect_overlaps_pairwise(shapes):
+    """Reference implementation comparing every pair of shapes."""
+    for i in range(len(shapes)):
+        for j in range(i + 1, len(shapes)):
+            shape1, shape2 = shapes[i], shapes[j]
+            overlaps, overlap_area = calculate_overlap(
+                (shape1.left, shape1.top, shape1.width, shape1.height),
+                (shape2.left, shape2.top, shape2.width, shape2.height),
+            )
+            if overlaps:
+                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+
+
+def time_detector(detector, shapes):
+    """Run a detector on fresh copies of shapes; return (seconds, overlap maps)."""
+    copies = [SimpleNamespace(**{**vars(s), "overlapping_shapes": {}}) for s in shapes]
+    start = time.perf_counter()
+    detector(copies)
+    elapsed = time.perf_counter() - start
+    return elapsed, [list(s.overlapping_shapes.items()) for s in copies]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark detect_overlaps")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 300, 1000, 5000],
+        help="Shape counts per synthetic slide (default: 10 100 300 1000 5000)",
+    )
+    parser.add_argument(
+        "--layouts",
+        nargs="+",
+        choices=["random", "stacked", "grid"],
+        default=["random", "stacked", "grid"],
+        help="Shape layouts to build (default: all)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'layout':>8} {'shapes':>8} {'pairs':>8} {'pairwise':>10} "
+        f"{'detect':>10} {'speedup':>8}"
+    )
+    for layout in args.layouts:
+        for count in args.sizes:
+            shapes = make_shapes(count, rng, layout)
+            pairwise_time, expected = time_detector(detect_overlaps_pairwise, shapes)
+            detect_time, actual = time_detector(detect_overlaps, shapes)
+            assert actual == expected, f"Overlap maps differ for {layout} {count}"
+
+            pairs = sum(len(overlaps) for overlaps in actual) // 2
+            print(
+                f"{layout:>8} {count:>8} {pairs:>8} {pairwise_time:>9.4f}s "
+                f"{detect_time:>9.4f}s "
+                f"{pairwise_time / max(detect_time, 1e-9):>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,21 +16,31 @@ Classes:
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    get_inventory_as_dict: Extract serialized data, optionally in parallel
     save_inventory: Save extracted data to JSON
+    save_inventory_jsonl: Stream extracted data to JSON lines, one slide per line
 
 Usage:
     python inventory.py input.pptx output.json
 """
 
 import argparse
+import hashlib
 import json
+import math
+import os
 import platform
 import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import ImageFont
 from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
 from pptx.shapes.base import BaseShape
@@ -60,12 +70,20 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 4
+    Extracts slides in 4 worker processes (same output, faster on large decks)
+
+  python inventory.py presentation.pptx inventory.jsonl
+    Streams one {"slide": ..., "shapes": ...} record per line for huge decks
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
   - Visual position and size in inches
   - Paragraph properties and formatting
   - Issue detection: text overflow and shape overlaps
+  - A "source" entry with the file name and SHA-256 content hash, so
+    replace.py --inventory can reuse the measurements
         """,
     )
 
@@ -76,6 +94,19 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to extract slides (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        help="Output format: one nested JSON document, or one JSON line per slide "
+        "written as soon as the slide is processed (default: jsonl for a .jsonl "
+        "output, json otherwise)",
+    )
 
     args = parser.parse_args()
 
@@ -88,23 +119,45 @@ The output JSON includes:
         print("Error: Input must be a PowerPoint file (.pptx)")
         sys.exit(1)
 
+    # load_inventory picks the reader from the suffix, so the two must agree
+    suffix_format = "jsonl" if Path(args.output).suffix.lower() == ".jsonl" else "json"
+    if args.format is None:
+        args.format = suffix_format
+    elif args.format != suffix_format:
+        print(
+            f"Error: --format {args.format} does not match the output file "
+            f"{args.output}; use a .jsonl file for jsonl and any other name for json"
+        )
+        sys.exit(1)
+
     try:
         print(f"Extracting text inventory from: {args.input}")
         if args.issues_only:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
-
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        source = get_inventory_source(input_path, issues_only=args.issues_only)
+
+        if args.format == "jsonl":
+            slides = iter_inventory_dicts(
+                input_path, issues_only=args.issues_only, jobs=args.jobs
+            )
+            total_slides, total_shapes = save_inventory_jsonl(
+                slides, output_path, source
+            )
+        else:
+            inventory = get_inventory_as_dict(
+                input_path, issues_only=args.issues_only, jobs=args.jobs
+            )
+            save_inventory_dict(inventory, output_path, source)
+            total_slides = len(inventory)
+            total_shapes = sum(len(shapes) for shapes in inventory.values())
 
         print(f"Output saved to: {args.output}")
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
         if args.issues_only:
             if total_shapes > 0:
                 print(
@@ -263,6 +316,143 @@ class ParagraphData:
         return result
 
 
+@lru_cache(maxsize=None)
+def _list_font_directories() -> List[Tuple[Path, List[Tuple[str, bool]], List[str]]]:
+    """List the platform's font directories once per process.
+
+    Returns:
+        (directory, [(entry name, is_file)], font extensions) for each existing
+        font directory, in search order
+    """
+    # Define font directories and extensions by platform
+    if platform.system() == "Darwin":  # macOS
+        font_dirs = [
+            "/System/Library/Fonts/",
+            "/Library/Fonts/",
+            "~/Library/Fonts/",
+        ]
+        extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+    else:  # Linux
+        font_dirs = [
+            "/usr/share/fonts/truetype/",
+            "/usr/local/share/fonts/",
+            "~/.fonts/",
+        ]
+        extensions = [".ttf", ".otf"]
+
+    directories = []
+    for font_dir in font_dirs:
+        font_dir_path = Path(font_dir).expanduser()
+        if not font_dir_path.exists():
+            continue
+        try:
+            entries = [
+                (entry.name, entry.is_file()) for entry in os.scandir(font_dir_path)
+            ]
+        except OSError:
+            entries = []
+        directories.append((font_dir_path, entries, extensions))
+    return directories
+
+
+# Per-character advance widths in pixels, per loaded font
+_GLYPH_ADVANCES: Dict[Any, Dict[str, float]] = {}
+
+
+# First font size of each text style, per slide master part. Keyed weakly so
+# the sizes go away with the presentation that loaded the master.
+_MASTER_STYLE_FONT_SIZES: "weakref.WeakKeyDictionary[Any, Dict[str, Optional[int]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _master_style_font_size(slide_master: Any, style_name: str) -> Optional[int]:
+    """Return the first font size in a slide master's text style, in points.
+
+    Every shape on slides using the master asks for this, so the walk over
+    the master XML is done once per (master, style).
+    """
+    sizes = _MASTER_STYLE_FONT_SIZES.setdefault(slide_master.part, {})
+    if style_name not in sizes:
+        sizes[style_name] = _find_style_font_size(slide_master.element, style_name)
+    return sizes[style_name]
+
+
+def _find_style_font_size(master_element: Any, style_name: str) -> Optional[int]:
+    """Walk a slide master's XML for the first font size in a text style."""
+    for child in master_element.iter():
+        tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
+        if tag == style_name:
+            for elem in child.iter():
+                if "sz" in elem.attrib:
+                    return int(elem.attrib["sz"]) // 100
+    return None
+
+
+def _measure_prefix_widths(line: str, font) -> np.ndarray:
+    """Return the widths of line[:i] for i in 0..len(line).
+
+    Widths are sums of per-character advances, which are measured once per
+    font, so any substring width is a difference of two entries.
+    """
+    advances = _GLYPH_ADVANCES.setdefault(font, {})
+    for char in set(line).difference(advances):
+        advances[char] = font.getlength(char)
+
+    prefix_widths = np.zeros(len(line) + 1)
+    np.cumsum(
+        np.fromiter((advances[char] for char in line), float, len(line)),
+        out=prefix_widths[1:],
+    )
+    return prefix_widths
+
+
+@lru_cache(maxsize=65536)
+def _wrap_text_line(line: str, max_width_px: int, font) -> Tuple[str, ...]:
+    """Greedily wrap a line at spaces so each piece fits within max_width_px.
+
+    Words wider than max_width_px get a line of their own. Results are cached,
+    since decks repeat a lot of text and replace.py inventories twice.
+    """
+    if not line:
+        return ("",)
+
+    prefix_widths = _measure_prefix_widths(line, font)
+    if prefix_widths[-1] <= max_width_px:
+        return (line,)
+
+    # Need to wrap - find word boundaries
+    word_starts = [0]
+    word_ends = []
+    for i, char in enumerate(line):
+        if char == " ":
+            word_ends.append(i)
+            word_starts.append(i + 1)
+    word_ends.append(len(line))
+    word_end_widths = prefix_widths[word_ends]
+
+    wrapped = []
+    word = 0
+    while word < len(word_starts):
+        # A line never starts with an empty word (from repeated spaces)
+        if word_starts[word] == word_ends[word]:
+            word += 1
+            continue
+
+        # Take the first word, plus every following word while the line fits
+        start = word_starts[word]
+        fitting = np.searchsorted(
+            word_end_widths[word + 1 :] - prefix_widths[start],
+            max_width_px,
+            side="right",
+        )
+        word += int(fitting)
+        wrapped.append(line[start : word_ends[word]])
+        word += 1
+
+    return tuple(wrapped)
+
+
 class ShapeData:
     """Data structure for shape properties extracted from a PowerPoint shape."""
 
@@ -277,17 +467,19 @@ class ShapeData:
         return int(inches * dpi)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_font_path(font_name: str) -> Optional[str]:
         """Get the font file path for a given font name.
 
+        Lookups are memoized, and font directories are listed only once per
+        process (see _list_font_directories).
+
         Args:
             font_name: Name of the font (e.g., 'Arial', 'Calibri')
 
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
         # Common font file variations to try
         font_variations = [
             font_name,
@@ -295,53 +487,41 @@ class ShapeData:
             font_name.replace(" ", ""),
             font_name.replace(" ", "-"),
         ]
+        font_name_lower = font_name.lower().replace(" ", "")
 
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
+        for font_dir_path, entries, extensions in _list_font_directories():
             # First try exact matches
+            entry_names = {name for name, _ in entries}
             for variant in font_variations:
                 for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
+                    if f"{variant}{ext}" in entry_names:
+                        return str(font_dir_path / f"{variant}{ext}")
 
             # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
+            for name, is_file in entries:
+                if is_file:
+                    file_name_lower = name.lower()
+                    if font_name_lower in file_name_lower and any(
+                        file_name_lower.endswith(ext) for ext in extensions
+                    ):
+                        return str(font_dir_path / name)
 
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load_font(font_path: Optional[str], font_size: int) -> Any:
+        """Load a font for text measurement, cached by (font_path, font_size).
+
+        Falls back to PIL's default font if font_path is None or unreadable.
+        """
+        if font_path:
+            try:
+                return ImageFont.truetype(font_path, size=font_size)
+            except Exception:
+                pass
+        return ImageFont.load_default()
+
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
         """Get slide dimensions from slide object.
@@ -391,6 +571,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        measure: bool = True,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,6 +580,8 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            measure: If False, skip the PIL text measurement for frame overflow
+                (used when the overflow is already known from a saved inventory)
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
@@ -428,30 +611,25 @@ class ShapeData:
         left_emu = (
             absolute_left
             if absolute_left is not None
-            else (shape.left if hasattr(shape, "left") else 0)
+            else getattr(shape, "left", 0)
         )
         top_emu = (
-            absolute_top
-            if absolute_top is not None
-            else (shape.top if hasattr(shape, "top") else 0)
+            absolute_top if absolute_top is not None else getattr(shape, "top", 0)
         )
+        # Read each size once: placeholders resolve it through the layout
+        width_emu = getattr(shape, "width", 0)
+        height_emu = getattr(shape, "height", 0)
 
         self.left: float = round(self.emu_to_inches(left_emu), 2)  # type: ignore
         self.top: float = round(self.emu_to_inches(top_emu), 2)  # type: ignore
-        self.width: float = round(
-            self.emu_to_inches(shape.width if hasattr(shape, "width") else 0),
-            2,  # type: ignore
-        )
-        self.height: float = round(
-            self.emu_to_inches(shape.height if hasattr(shape, "height") else 0),
-            2,  # type: ignore
-        )
+        self.width: float = round(self.emu_to_inches(width_emu), 2)  # type: ignore
+        self.height: float = round(self.emu_to_inches(height_emu), 2)  # type: ignore
 
         # Store EMU positions for overflow calculations
         self.left_emu = left_emu
         self.top_emu = top_emu
-        self.width_emu = shape.width if hasattr(shape, "width") else 0
-        self.height_emu = shape.height if hasattr(shape, "height") else 0
+        self.width_emu = width_emu
+        self.height_emu = height_emu
 
         # Calculate overflow status
         self.frame_overflow_bottom: Optional[float] = None
@@ -461,7 +639,8 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
-        self._estimate_frame_overflow()
+        if measure:
+            self._estimate_frame_overflow()
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
@@ -495,12 +674,9 @@ class ShapeData:
                 style_name = "titleStyle"
 
             # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            font_size = _master_style_font_size(slide_master, style_name)
+            if font_size is not None:
+                return font_size
         except Exception:
             pass
 
@@ -531,33 +707,9 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
+    def _wrap_text_line(self, line: str, max_width_px: int, font) -> List[str]:
         """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
-
-        return wrapped
+        return _wrap_text_line(line, max_width_px, font)
 
     def _estimate_frame_overflow(self) -> None:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
@@ -573,10 +725,6 @@ class ShapeData:
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
@@ -593,20 +741,12 @@ class ShapeData:
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font = self.load_font(self.get_font_path(font_name), font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
             for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
+                wrapped = self._wrap_text_line(line, usable_width_px, font)
                 all_wrapped_lines.extend(wrapped)
 
             if all_wrapped_lines:
@@ -678,6 +818,16 @@ class ShapeData:
                 )
                 break
 
+    def remeasure(self) -> None:
+        """Recompute the text-dependent results after the shape's text changed.
+
+        Position, size and placeholder information are kept as they are.
+        """
+        self.frame_overflow_bottom = None
+        self.warnings = []
+        self._estimate_frame_overflow()
+        self._detect_bullet_issues()
+
     @property
     def has_any_issues(self) -> bool:
         """Check if shape has any issues (overflow, overlap, or warnings)."""
@@ -783,8 +933,8 @@ def collect_shapes_with_absolute_positions(
     if hasattr(shape, "shapes"):  # GroupShape
         result = []
         # Get this group's position
-        group_left = shape.left if hasattr(shape, "left") else 0
-        group_top = shape.top if hasattr(shape, "top") else 0
+        group_left = getattr(shape, "left", 0)
+        group_top = getattr(shape, "top", 0)
 
         # Calculate absolute position for this group
         abs_group_left = parent_left + group_left
@@ -802,8 +952,8 @@ def collect_shapes_with_absolute_positions(
     # Regular shape - check if it has valid text
     if is_valid_shape(shape):
         # Calculate absolute position
-        shape_left = shape.left if hasattr(shape, "left") else 0
-        shape_top = shape.top if hasattr(shape, "top") else 0
+        shape_left = getattr(shape, "left", 0)
+        shape_top = getattr(shape, "top", 0)
 
         return [
             ShapeWithPosition(
@@ -879,40 +1029,130 @@ def calculate_overlap(
     return False, 0
 
 
-def detect_overlaps(shapes: List[ShapeData]) -> None:
+def detect_overlaps(shapes: List[ShapeData], tolerance: float = 0.05) -> None:
     """Detect overlapping shapes and update their overlapping_shapes dictionaries.
 
     This function requires each ShapeData to have its shape_id already set.
     It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
 
+    Shapes are bucketed into a uniform grid of cells about the size of an
+    average shape, and only shapes sharing a cell are compared, so stacked
+    rows and columns cost no more than scattered shapes.
+
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
+        tolerance: Minimum overlap in inches to consider as overlapping (default: 0.05")
     """
     n = len(shapes)
+    if n < 2:
+        return
+
+    # Ensure shape IDs are set
+    for i, shape in enumerate(shapes):
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    # Cells are at least an average shape in size, and few enough per axis that
+    # a shape spanning the whole slide only lands in O(n) cells
+    rects = [(s.left, s.top, s.width, s.height) for s in shapes]
+    max_cells = 2 * math.isqrt(n) + 1
+    span_x = max(l + w for l, _, w, _ in rects) - min(l for l, _, _, _ in rects)
+    span_y = max(t + h for _, t, _, h in rects) - min(t for _, t, _, _ in rects)
+    cell_width = max(sum(r[2] for r in rects) / n, span_x / max_cells) or 1.0
+    cell_height = max(sum(r[3] for r in rects) / n, span_y / max_cells) or 1.0
+
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for i, (left, top, width, height) in enumerate(rects):
+        for cx in range(
+            math.floor(left / cell_width), math.floor((left + width) / cell_width) + 1
+        ):
+            for cy in range(
+                math.floor(top / cell_height),
+                math.floor((top + height) / cell_height) + 1,
+            ):
+                cells.setdefault((cx, cy), []).append(i)
+
+    pairs = []
+    for cell, members in cells.items():
+        for position, i in enumerate(members):
+            left1, top1, _, _ = rects[i]
+            for j in members[position + 1 :]:
+                left2, top2, _, _ = rects[j]
+                # Overlapping shapes share every cell their overlap touches;
+                # only compare them in the one holding its top-left corner
+                corner = (
+                    math.floor(max(left1, left2) / cell_width),
+                    math.floor(max(top1, top2) / cell_height),
+                )
+                if corner != cell:
+                    continue
+                overlaps, overlap_area = calculate_overlap(
+                    rects[i], rects[j], tolerance
+                )
+                if overlaps:
+                    pairs.append((i, j, overlap_area))
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    # Record pairs in input order so dictionaries keep the same key order
+    for i, j, overlap_area in sorted(pairs):
+        # Add shape IDs with overlap area in square inches
+        shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+        shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False, measure: bool = True
+) -> Dict[str, "ShapeData"]:
+    """Extract text content from a single slide.
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+    Args:
+        slide: The python-pptx slide to inspect
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        measure: If False, skip text measurement (frame overflow is left unset)
+
+    Returns a dictionary {shape-N: ShapeData} sorted by visual position, or an
+    empty dictionary if the slide has no text shapes to report.
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            measure,
+        )
+        for swp in shapes_with_positions
+    ]
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    measure: bool = True,
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,6 +1160,8 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        measure: If False, only locate shapes and skip text measurement, which is
+            the expensive part; frame overflow is then left unset
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
@@ -931,73 +1173,98 @@ def extract_text_inventory(
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+        shapes = extract_slide_inventory(slide, issues_only, measure)
+        if shapes:
+            inventory[f"slide-{slide_idx}"] = shapes
 
-        if not shapes_with_positions:
-            continue
+    return inventory
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+# Presentation opened once by each worker process of iter_inventory_dicts
+_worker_presentation: Optional[Any] = None
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+def _init_inventory_worker(pptx_path: str) -> None:
+    """Open the presentation in a freshly started worker process."""
+    global _worker_presentation
+    _worker_presentation = Presentation(pptx_path)
 
-        if not sorted_shapes:
-            continue
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+def _extract_slide_dict(slide_idx: int, issues_only: bool) -> Dict[str, ShapeDict]:
+    """Extract one slide of the worker's presentation as JSON-ready dictionaries.
 
-    return inventory
+    ShapeData keeps references to python-pptx objects, which cannot be sent
+    back to the parent process, so workers return the serialized form.
+    """
+    slide = _worker_presentation.slides[slide_idx]  # type: ignore
+    shapes = extract_slide_inventory(slide, issues_only)
+    return {shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()}
 
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+def iter_inventory_dicts(
+    pptx_path: Path, issues_only: bool = False, jobs: int = 1
+) -> Iterator[Tuple[str, Dict[str, ShapeDict]]]:
+    """Yield (slide-N, {shape-N: ShapeDict}) pairs in presentation order.
+
+    Slides without text shapes are skipped, exactly as in extract_text_inventory.
+    With jobs > 1 the slides are shared across a pool of worker processes; each
+    worker opens the presentation itself and results are yielded in slide order.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes to use
+    """
+    prs = Presentation(str(pptx_path))
+
+    if jobs <= 1:
+        for slide_idx, slide in enumerate(prs.slides):
+            shapes = extract_slide_inventory(slide, issues_only)
+            if shapes:
+                yield f"slide-{slide_idx}", {
+                    shape_key: shape_data.to_dict()
+                    for shape_key, shape_data in shapes.items()
+                }
+        return
+
+    slide_count = len(prs.slides)
+    del prs
+    # A few chunks per worker keeps the pool balanced when slide sizes vary
+    chunksize = max(1, slide_count // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path),),
+    ) as executor:
+        results = executor.map(
+            _extract_slide_dict,
+            range(slide_count),
+            repeat(issues_only),
+            chunksize=chunksize,
+        )
+        for slide_idx, shapes in enumerate(results):
+            if shapes:
+                yield f"slide-{slide_idx}", shapes
+
+
+def get_inventory_as_dict(
+    pptx_path: Path, issues_only: bool = False, jobs: int = 1
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
-    This is a convenience wrapper around extract_text_inventory that returns
+    This is a convenience wrapper around iter_inventory_dicts that returns
     dictionaries instead of ShapeData objects, useful for testing and direct
     JSON serialization.
 
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Number of worker processes used to extract slides
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
-
-    # Convert ShapeData objects to dictionaries
-    dict_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        dict_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
-
-    return dict_inventory
+    return dict(iter_inventory_dicts(pptx_path, issues_only=issues_only, jobs=jobs))
 
 
 def save_inventory(inventory: InventoryData, output_path: Path) -> None:
@@ -1012,9 +1279,103 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
 
+    save_inventory_dict(json_inventory, output_path)
+
+
+def save_inventory_dict(
+    json_inventory: InventoryDict,
+    output_path: Path,
+    source: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Save an already serialized inventory to JSON file with proper formatting.
+
+    If source is given (see get_inventory_source) it is stored under a top-level
+    "source" key ahead of the slides.
+    """
+    if source is not None:
+        json_inventory = {"source": source, **json_inventory}  # type: ignore
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(json_inventory, f, indent=2, ensure_ascii=False)
 
 
+def save_inventory_jsonl(
+    slides: Iterable[Tuple[str, Dict[str, ShapeDict]]],
+    output_path: Path,
+    source: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, int]:
+    """Stream inventory slides to a JSON-lines file, one record per slide.
+
+    Each line is {"slide": "slide-N", "shapes": {shape-N: ShapeDict}}, preceded
+    by a {"source": ...} line if source is given. Lines are flushed as soon as a
+    slide is processed, so only one slide is held in memory when slides come
+    from iter_inventory_dicts.
+
+    Returns:
+        Tuple of (slides written, shapes written)
+    """
+    total_slides = 0
+    total_shapes = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        if source is not None:
+            f.write(json.dumps({"source": source}, ensure_ascii=False) + "\n")
+        for slide_key, shapes in slides:
+            record = {"slide": slide_key, "shapes": shapes}
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            total_slides += 1
+            total_shapes += len(shapes)
+    return total_slides, total_shapes
+
+
+def compute_file_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_inventory_source(pptx_path: Path, issues_only: bool = False) -> Dict[str, Any]:
+    """Describe the presentation an inventory was extracted from.
+
+    The content hash lets replace.py reuse a saved inventory instead of measuring
+    the presentation again, and reject inventories of a different or edited file.
+    """
+    return {
+        "file": pptx_path.name,
+        "sha256": compute_file_hash(pptx_path),
+        "issues_only": issues_only,
+    }
+
+
+def load_inventory(
+    input_path: Path,
+) -> Tuple[Optional[Dict[str, Any]], InventoryDict]:
+    """Load an inventory saved by inventory.py in either output format.
+
+    Returns:
+        Tuple of (source metadata, or None if the file has none, inventory)
+    """
+    if input_path.suffix.lower() != ".jsonl":
+        with open(input_path, "r", encoding="utf-8") as f:
+            inventory = json.load(f)
+        source = inventory.pop("source", None)
+        return source, inventory
+
+    source = None
+    inventory: InventoryDict = {}
+    with open(input_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "slide" in record:
+                inventory[record["slide"]] = record.get("shapes", {})
+            elif "source" in record:
+                source = record["source"]
+    return source, inventory
+
+
 if __name__ == "__main__":
     main()
@@ -2,19 +2,37 @@
 """Apply text replacements to PowerPoint presentation.
 
 Usage:
-    python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py <input.pptx> <replacements.json> <output.pptx> [--inventory inventory.json]
+    python replace.py <template.pptx> --batch <dir|glob|manifest.jsonl> --output-dir <dir> [--jobs N]
 
 The replacements JSON should have the structure output by inventory.py.
+A .jsonl file with one {"slide": ..., "shapes": ...} record per line (as
+written by `inventory.py` to a .jsonl file) is read lazily, one slide at a time.
 ALL text shapes identified by inventory.py will have their text cleared
 unless "paragraphs" is specified in the replacements for that shape.
 """
 
+import argparse
+import copy
+import glob
 import json
 import sys
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
 from pathlib import Path
-from typing import Any, Dict, List
-
-from inventory import InventoryData, extract_text_inventory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from inventory import (
+    InventoryData,
+    compute_file_hash,
+    extract_text_inventory,
+    load_inventory,
+)
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
@@ -167,36 +185,50 @@ def validate_replacements(inventory: InventoryData, replacements: Dict) -> List[
     errors = []
 
     for slide_key, shapes_data in replacements.items():
-        if not slide_key.startswith("slide-"):
-            continue
+        errors.extend(validate_slide_replacements(inventory, slide_key, shapes_data))
 
-        # Check if slide exists
-        if slide_key not in inventory:
-            errors.append(f"Slide '{slide_key}' not found in inventory")
-            continue
+    return errors
 
-        # Check each shape
-        for shape_key in shapes_data.keys():
-            if shape_key not in inventory[slide_key]:
-                # Find shapes without replacements defined and show their content
-                unused_with_content = []
-                for k in inventory[slide_key].keys():
-                    if k not in shapes_data:
-                        shape_data = inventory[slide_key][k]
-                        # Get text from paragraphs as preview
-                        paragraphs = shape_data.paragraphs
-                        if paragraphs and paragraphs[0].text:
-                            first_text = paragraphs[0].text[:50]
-                            if len(paragraphs[0].text) > 50:
-                                first_text += "..."
-                            unused_with_content.append(f"{k} ('{first_text}')")
-                        else:
-                            unused_with_content.append(k)
-
-                errors.append(
-                    f"Shape '{shape_key}' not found on '{slide_key}'. "
-                    f"Shapes without replacements: {', '.join(sorted(unused_with_content)) if unused_with_content else 'none'}"
-                )
+
+def validate_slide_replacements(
+    inventory: InventoryData, slide_key: str, shapes_data: Dict
+) -> List[str]:
+    """Validate the replacements for a single slide against the inventory.
+
+    Returns list of error messages.
+    """
+    errors = []
+
+    if not slide_key.startswith("slide-"):
+        return errors
+
+    # Check if slide exists
+    if slide_key not in inventory:
+        errors.append(f"Slide '{slide_key}' not found in inventory")
+        return errors
+
+    # Check each shape
+    for shape_key in shapes_data.keys():
+        if shape_key not in inventory[slide_key]:
+            # Find shapes without replacements defined and show their content
+            unused_with_content = []
+            for k in inventory[slide_key].keys():
+                if k not in shapes_data:
+                    shape_data = inventory[slide_key][k]
+                    # Get text from paragraphs as preview
+                    paragraphs = shape_data.paragraphs
+                    if paragraphs and paragraphs[0].text:
+                        first_text = paragraphs[0].text[:50]
+                        if len(paragraphs[0].text) > 50:
+                            first_text += "..."
+                        unused_with_content.append(f"{k} ('{first_text}')")
+                    else:
+                        unused_with_content.append(k)
+
+            errors.append(
+                f"Shape '{shape_key}' not found on '{slide_key}'. "
+                f"Shapes without replacements: {', '.join(sorted(unused_with_content)) if unused_with_content else 'none'}"
+            )
 
     return errors
 
@@ -211,75 +243,213 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
+def iter_replacements(json_file: str) -> Iterator[Tuple[str, Dict]]:
+    """Yield (slide_key, shapes) pairs from a replacements file.
 
-    # Load presentation
-    prs = Presentation(pptx_file)
+    Files ending in .jsonl are read lazily, one {"slide": ..., "shapes": ...}
+    record per line, so only one slide is held in memory. Any other file is
+    loaded as a single JSON document with the structure output by inventory.py.
+    """
+    if Path(json_file).suffix.lower() != ".jsonl":
+        with open(json_file, "r") as f:
+            replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
+        yield from replacements.items()
+        return
+
+    seen_slides = set()
+    with open(json_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line, object_pairs_hook=check_duplicate_keys)
+            except ValueError as e:
+                raise ValueError(f"Line {line_number}: {e}") from e
 
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
+            if isinstance(record, dict) and "source" in record and len(record) == 1:
+                continue  # Metadata line written by inventory.py
 
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
+            slide_key = record.get("slide") if isinstance(record, dict) else None
+            if not isinstance(slide_key, str):
+                raise ValueError(f"Line {line_number}: record has no 'slide' key")
+            if slide_key in seen_slides:
+                raise ValueError(f"Duplicate key found in JSON: '{slide_key}'")
+            seen_slides.add(slide_key)
 
-    # Load replacement data with duplicate key detection
-    with open(json_file, "r") as f:
-        replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
+            yield slide_key, record.get("shapes", {})
 
-    # Validate replacements
-    errors = validate_replacements(inventory, replacements)
-    if errors:
-        print("ERROR: Invalid shapes in replacement JSON:")
-        for error in errors:
-            print(f"  - {error}")
-        print("\nPlease check the inventory and update your replacement JSON.")
-        print(
-            "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
+
+def load_saved_overflow(
+    pptx_file: str, inventory_file: str, inventory: InventoryData
+) -> Dict[str, Dict[str, float]]:
+    """Read the original frame overflow from an inventory saved by inventory.py.
+
+    The saved inventory must carry the content hash of pptx_file and list the
+    same shapes as the freshly located inventory, otherwise it is rejected.
+
+    Returns dict of slide_key -> shape_key -> overflow_inches.
+    """
+    source, saved = load_inventory(Path(inventory_file))
+    if not source or source.get("sha256") != compute_file_hash(Path(pptx_file)):
+        raise ValueError(
+            f"Inventory '{inventory_file}' does not match the content of '{pptx_file}'. "
+            "Regenerate it with: python inventory.py <input.pptx> <output.json>"
+        )
+    if source.get("issues_only"):
+        raise ValueError(
+            f"Inventory '{inventory_file}' was saved with --issues-only and cannot be reused"
         )
-        raise ValueError(f"Found {len(errors)} validation error(s)")
 
-    # Track statistics
+    saved_shapes = {slide_key: list(shapes) for slide_key, shapes in saved.items()}
+    located_shapes = {
+        slide_key: list(shapes) for slide_key, shapes in inventory.items()
+    }
+    if saved_shapes != located_shapes:
+        raise ValueError(
+            f"Inventory '{inventory_file}' lists different shapes than '{pptx_file}'. "
+            "Regenerate it with the current inventory.py"
+        )
+
+    overflow_map = {}
+    for slide_key, shapes in saved.items():
+        for shape_key, shape_dict in shapes.items():
+            frame = shape_dict.get("overflow", {}).get("frame")
+            if frame:
+                if slide_key not in overflow_map:
+                    overflow_map[slide_key] = {}
+                overflow_map[slide_key][shape_key] = frame["overflow_bottom"]
+
+    return overflow_map
+
+
+def clear_slide_shapes(prs, slide_key: str, shapes_dict) -> Tuple[int, int]:
+    """Clear the text of every inventory shape on a slide.
+
+    Returns tuple of (shapes processed, shapes cleared).
+    """
     shapes_processed = 0
     shapes_cleared = 0
-    shapes_replaced = 0
 
-    # Process each slide from inventory
-    for slide_key, shapes_dict in inventory.items():
-        if not slide_key.startswith("slide-"):
-            continue
+    slide_index = int(slide_key.split("-")[1])
 
-        slide_index = int(slide_key.split("-")[1])
+    if slide_index >= len(prs.slides):
+        print(f"Warning: Slide {slide_index} not found")
+        return shapes_processed, shapes_cleared
 
-        if slide_index >= len(prs.slides):
-            print(f"Warning: Slide {slide_index} not found")
+    # Process each shape from inventory
+    for shape_key, shape_data in shapes_dict.items():
+        shapes_processed += 1
+
+        # Get the shape directly from ShapeData
+        shape = shape_data.shape
+        if not shape:
+            print(f"Warning: {shape_key} has no shape reference")
             continue
 
-        # Process each shape from inventory
-        for shape_key, shape_data in shapes_dict.items():
-            shapes_processed += 1
+        # ShapeData already validates text_frame in __init__
+        text_frame = shape.text_frame  # type: ignore
 
-            # Get the shape directly from ShapeData
-            shape = shape_data.shape
-            if not shape:
-                print(f"Warning: {shape_key} has no shape reference")
+        # Measuring a shape reads paragraph properties through python-pptx,
+        # which adds an empty <a:pPr/> to every paragraph with text. Add it
+        # here too so cleared shapes are the same whether or not they were
+        # measured in this process.
+        first_paragraph = text_frame.paragraphs[0]  # type: ignore
+        if first_paragraph.text.strip():
+            first_paragraph._p.get_or_add_pPr()
+
+        text_frame.clear()  # type: ignore
+        shapes_cleared += 1
+
+    return shapes_processed, shapes_cleared
+
+
+def measure_replaced_shapes(inventory: InventoryData, replaced: set) -> InventoryData:
+    """Measure only the shapes that received replacement text.
+
+    Shapes that were just cleared have no text left and cannot overflow, so
+    they are skipped. Measuring reads font colors, which adds empty
+    <a:solidFill/> elements, so each text body is restored from a copy
+    afterwards to leave the presentation untouched.
+
+    Returns an inventory containing only the measured shapes, in inventory order.
+    """
+    measured: InventoryData = {}
+
+    for slide_key, shapes_dict in inventory.items():
+        for shape_key, shape_data in shapes_dict.items():
+            if (slide_key, shape_key) not in replaced:
                 continue
 
-            # ShapeData already validates text_frame in __init__
-            text_frame = shape.text_frame  # type: ignore
+            txBody = shape_data.shape.text_frame._txBody  # type: ignore
+            snapshot = copy.deepcopy(txBody)
+            try:
+                shape_data.remeasure()
+            finally:
+                txBody.getparent().replace(txBody, snapshot)
+
+            if slide_key not in measured:
+                measured[slide_key] = {}
+            measured[slide_key][shape_key] = shape_data
+
+    return measured
+
+
+def fill_presentation(
+    prs,
+    inventory: InventoryData,
+    original_overflow: Dict[str, Dict[str, float]],
+    replacements: Iterable[Tuple[str, Dict]],
+) -> Dict[str, Any]:
+    """Clear every inventory shape and apply replacements to prs in memory.
+
+    Args:
+        prs: Presentation the inventory was extracted from
+        inventory: Inventory of prs (ShapeData objects)
+        original_overflow: Frame overflow before replacement, as returned by
+            detect_frame_overflow
+        replacements: (slide_key, shapes) pairs, e.g. from iter_replacements
+
+    Returns:
+        Dict with the "errors" found while validating replacements, the
+        "overflow_errors" and "warnings" found in the result, and the
+        shapes_processed / shapes_cleared / shapes_replaced counts. The
+        overflow check is skipped when there are validation errors.
+    """
+    # Track statistics
+    shapes_processed = 0
+    shapes_cleared = 0
+    shapes_replaced = 0
+    cleared_slides = set()
+    replaced = set()
 
-            text_frame.clear()  # type: ignore
-            shapes_cleared += 1
+    # Stream replacement data slide by slide, validating each slide before it is
+    # cleared so error messages can still show the original text.
+    errors = []
+    for slide_key, shapes_data in replacements:
+        slide_errors = validate_slide_replacements(inventory, slide_key, shapes_data)
+        errors.extend(slide_errors)
+        if errors or slide_key not in inventory:
+            continue
+
+        processed, cleared = clear_slide_shapes(prs, slide_key, inventory[slide_key])
+        shapes_processed += processed
+        shapes_cleared += cleared
+        cleared_slides.add(slide_key)
 
+        for shape_key, replacement_shape_data in shapes_data.items():
             # Check for replacement paragraphs
-            replacement_shape_data = replacements.get(slide_key, {}).get(shape_key, {})
             if "paragraphs" not in replacement_shape_data:
                 continue
 
+            shape = inventory[slide_key][shape_key].shape
+            if not shape:
+                continue
+
             shapes_replaced += 1
+            replaced.add((slide_key, shape_key))
 
             # Add replacement paragraphs
+            text_frame = shape.text_frame  # type: ignore
             for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
                 if i == 0:
                     p = text_frame.paragraphs[0]  # type: ignore
@@ -288,23 +458,30 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
+    result = {
+        "errors": errors,
+        "overflow_errors": [],
+        "warnings": [],
+        "shapes_processed": shapes_processed,
+        "shapes_cleared": shapes_cleared,
+        "shapes_replaced": shapes_replaced,
+    }
+    if errors:
+        return result
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
+    # ALL text shapes without replacements are cleared as well
+    for slide_key, shapes_dict in inventory.items():
+        if slide_key.startswith("slide-") and slide_key not in cleared_slides:
+            processed, cleared = clear_slide_shapes(prs, slide_key, shapes_dict)
+            result["shapes_processed"] += processed
+            result["shapes_cleared"] += cleared
 
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+    # Check for issues after replacements, re-measuring only the shapes that
+    # received new text
+    updated_inventory = measure_replaced_shapes(inventory, replaced)
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
-    overflow_errors = []
     for slide_key, shape_overflows in updated_overflow.items():
         for shape_key, new_overflow in shape_overflows.items():
             # Get original overflow (0 if there was no overflow before)
@@ -313,20 +490,68 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
             # Error if overflow increased
             if new_overflow > original + 0.01:  # Small tolerance for rounding
                 increase = new_overflow - original
-                overflow_errors.append(
+                result["overflow_errors"].append(
                     f'{slide_key}/{shape_key}: overflow worsened by {increase:.2f}" '
                     f'(was {original:.2f}", now {new_overflow:.2f}")'
                 )
 
     # Collect warnings from updated shapes
-    warnings = []
     for slide_key, shapes_dict in updated_inventory.items():
         for shape_key, shape_data in shapes_dict.items():
             if shape_data.warnings:
                 for warning in shape_data.warnings:
-                    warnings.append(f"{slide_key}/{shape_key}: {warning}")
+                    result["warnings"].append(f"{slide_key}/{shape_key}: {warning}")
+
+    return result
+
+
+def apply_replacements(
+    pptx_file: str,
+    json_file: str,
+    output_file: str,
+    inventory_file: Optional[str] = None,
+):
+    """Apply text replacements from JSON to PowerPoint presentation.
+
+    If inventory_file is given, the original overflow is taken from that saved
+    inventory (checked against the presentation's content hash) instead of
+    measuring every shape again.
+    """
+
+    # Load presentation
+    prs = Presentation(pptx_file)
+
+    # Get inventory of all text shapes (returns ShapeData objects)
+    # Pass prs to use same Presentation instance
+    if inventory_file:
+        # Only locate the shapes; measurements come from the saved inventory
+        inventory = extract_text_inventory(Path(pptx_file), prs, measure=False)
+        original_overflow = load_saved_overflow(pptx_file, inventory_file, inventory)
+    else:
+        inventory = extract_text_inventory(Path(pptx_file), prs)
+
+        # Detect text overflow in original presentation
+        original_overflow = detect_frame_overflow(inventory)
+
+    # Nothing is saved if any slide fails validation
+    result = fill_presentation(
+        prs, inventory, original_overflow, iter_replacements(json_file)
+    )
+
+    errors = result["errors"]
+    if errors:
+        print("ERROR: Invalid shapes in replacement JSON:")
+        for error in errors:
+            print(f"  - {error}")
+        print("\nPlease check the inventory and update your replacement JSON.")
+        print(
+            "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
+        )
+        raise ValueError(f"Found {len(errors)} validation error(s)")
 
     # Fail if there are any issues
+    overflow_errors = result["overflow_errors"]
+    warnings = result["warnings"]
     if overflow_errors or warnings:
         print("\nERROR: Issues detected in replacement output:")
         if overflow_errors:
@@ -348,31 +573,369 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     # Report results
     print(f"Saved updated presentation to: {output_file}")
     print(f"Processed {len(prs.slides)} slides")
-    print(f"  - Shapes processed: {shapes_processed}")
-    print(f"  - Shapes cleared: {shapes_cleared}")
-    print(f"  - Shapes replaced: {shapes_replaced}")
+    print(f"  - Shapes processed: {result['shapes_processed']}")
+    print(f"  - Shapes cleared: {result['shapes_cleared']}")
+    print(f"  - Shapes replaced: {result['shapes_replaced']}")
+
+
+def load_template(
+    pptx_file: str,
+    inventory_file: Optional[str] = None,
+    original_overflow: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, Any]:
+    """Load and inventory a template once so it can be filled many times.
+
+    Args:
+        pptx_file: Template presentation
+        inventory_file: Optional inventory saved by inventory.py for pptx_file
+        original_overflow: Frame overflow already measured for pptx_file; if
+            given, the shapes are only located
+
+    Returns:
+        Dict with the presentation, its inventory, the original overflow and a
+        copy of every inventory shape's text body for fill_template to restore.
+    """
+    prs = Presentation(pptx_file)
+
+    if original_overflow is not None:
+        inventory = extract_text_inventory(Path(pptx_file), prs, measure=False)
+    elif inventory_file:
+        inventory = extract_text_inventory(Path(pptx_file), prs, measure=False)
+        original_overflow = load_saved_overflow(pptx_file, inventory_file, inventory)
+    else:
+        inventory = extract_text_inventory(Path(pptx_file), prs)
+        original_overflow = detect_frame_overflow(inventory)
+
+    text_bodies = {}
+    for slide_key, shapes_dict in inventory.items():
+        for shape_key, shape_data in shapes_dict.items():
+            txBody = shape_data.shape.text_frame._txBody  # type: ignore
+            text_bodies[(slide_key, shape_key)] = copy.deepcopy(txBody)
+
+    return {
+        "prs": prs,
+        "inventory": inventory,
+        "original_overflow": original_overflow,
+        "text_bodies": text_bodies,
+    }
+
+
+def fill_template(
+    template: Dict[str, Any], replacements: Union[str, Dict], output_file: str
+) -> Dict[str, Any]:
+    """Fill a loaded template from one set of replacements and save it if clean.
+
+    Only text bodies of inventory shapes are changed, so restoring them from
+    the copies made by load_template resets the template for the next deck.
+
+    Args:
+        template: Template returned by load_template
+        replacements: Path of a replacements file, or the replacements dict itself
+        output_file: Where to save the filled presentation
+
+    Returns:
+        Report dict with "output", "status" ("success" or "failed"), the
+        errors, overflow errors and warnings, shape counts and "seconds".
+    """
+    start_time = time.perf_counter()
+    try:
+        if isinstance(replacements, dict):
+            pairs = replacements.items()
+        else:
+            pairs = iter_replacements(replacements)
+        result = fill_presentation(
+            template["prs"], template["inventory"], template["original_overflow"], pairs
+        )
+        failed = bool(
+            result["errors"] or result["overflow_errors"] or result["warnings"]
+        )
+        if not failed:
+            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+            template["prs"].save(output_file)
+    except Exception as e:
+        failed = True
+        result = {"errors": [str(e)], "overflow_errors": [], "warnings": []}
+    finally:
+        for (slide_key, shape_key), original in template["text_bodies"].items():
+            shape = template["inventory"][slide_key][shape_key].shape
+            txBody = shape.text_frame._txBody  # type: ignore
+            txBody.getparent().replace(txBody, copy.deepcopy(original))
+
+    return {
+        "output": str(output_file),
+        "status": "failed" if failed else "success",
+        **result,
+        "seconds": round(time.perf_counter() - start_time, 3),
+    }
+
+
+def batch_output_path(output_dir: Path, name: str) -> Path:
+    """Return output_dir / name, refusing names that resolve outside output_dir."""
+    output_path = output_dir / name
+    resolved_dir = output_dir.resolve()
+    resolved_path = output_path.resolve()
+    if resolved_path == resolved_dir or resolved_dir not in resolved_path.parents:
+        raise ValueError(f"output '{name}' is outside the output directory")
+    return output_path
+
+
+def iter_batch_jobs(batch: str, output_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yield one job per output deck of a batch.
+
+    batch is either a directory or glob of replacement files (.json or .jsonl,
+    one deck each, saved as <output_dir>/<name>.pptx), or a .jsonl manifest
+    with one {"output": "name.pptx", "replacements": {...}} record per deck,
+    read lazily line by line.
+
+    Each job is a dict with "source", "replacements" (path or dict) and
+    "output"; manifest lines that cannot be parsed, and jobs writing an
+    output already written by an earlier job, carry an "error" instead.
+    """
+    claimed = {}
+    for job in _read_batch_jobs(batch, output_dir):
+        if "error" not in job:
+            output_path = Path(job["output"]).resolve()
+            if output_path in claimed:
+                job = {
+                    "source": job["source"],
+                    "output": job["output"],
+                    "error": f"output '{job['output']}' is also written by "
+                    f"{claimed[output_path]}",
+                }
+            else:
+                claimed[output_path] = job["source"]
+        yield job
+
+
+def _read_batch_jobs(batch: str, output_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the jobs of a batch as listed, see iter_batch_jobs."""
+    batch_path = Path(batch)
+
+    if batch_path.is_file():
+        with open(batch_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                job = {
+                    "source": f"{batch}:{line_number}",
+                    "output": str(output_dir / f"deck-{line_number}.pptx"),
+                }
+                try:
+                    record = json.loads(line, object_pairs_hook=check_duplicate_keys)
+                    if not isinstance(record.get("replacements"), dict):
+                        raise ValueError("record has no 'replacements' object")
+                    if not isinstance(record.get("output", ""), str):
+                        raise ValueError("record 'output' is not a file name")
+                    if record.get("output"):
+                        job["output"] = str(
+                            batch_output_path(output_dir, record["output"])
+                        )
+                    job["replacements"] = record["replacements"]
+                except (ValueError, AttributeError) as e:
+                    job["error"] = str(e)
+                yield job
+        return
+
+    if batch_path.is_dir():
+        files = [
+            f for f in batch_path.iterdir() if f.suffix.lower() in (".json", ".jsonl")
+        ]
+    else:
+        files = [Path(f) for f in glob.glob(batch)]
+
+    for replacements_file in sorted(files):
+        yield {
+            "source": str(replacements_file),
+            "replacements": str(replacements_file),
+            "output": str(output_dir / f"{replacements_file.stem}.pptx"),
+        }
+
+
+# Template loaded once by each worker process of fill_batch
+_batch_template: Optional[Dict[str, Any]] = None
+
+
+def _init_batch_worker(
+    pptx_file: str, original_overflow: Dict[str, Dict[str, float]]
+) -> None:
+    """Load the template in a freshly started worker process."""
+    global _batch_template
+    _batch_template = load_template(pptx_file, original_overflow=original_overflow)
+
+
+def _fill_batch_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill one deck from the worker's template."""
+    report = fill_template(_batch_template, job["replacements"], job["output"])  # type: ignore
+    return {"source": job["source"], **report}
+
+
+def fill_batch(
+    pptx_file: str,
+    jobs_iter: Iterable[Dict[str, Any]],
+    jobs: int = 1,
+    inventory_file: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Fill one template from many replacement sets.
+
+    The template is loaded and measured once; with jobs > 1, worker processes
+    each load it once more but reuse that measurement and only locate shapes.
+    Jobs are read lazily with a bounded number in flight.
+
+    Args:
+        pptx_file: Template presentation
+        jobs_iter: Jobs as yielded by iter_batch_jobs
+        jobs: Number of worker processes
+        inventory_file: Optional inventory saved by inventory.py for pptx_file
+
+    Yields:
+        One report per job (see fill_template) with "source" added, in
+        completion order
+    """
+    template = load_template(pptx_file, inventory_file)
+
+    def failed_report(job):
+        return {
+            "source": job["source"],
+            "output": job["output"],
+            "status": "failed",
+            "errors": [job["error"]],
+            "overflow_errors": [],
+            "warnings": [],
+            "seconds": 0.0,
+        }
+
+    if jobs <= 1:
+        for job in jobs_iter:
+            if "error" in job:
+                yield failed_report(job)
+                continue
+            report = fill_template(template, job["replacements"], job["output"])
+            yield {"source": job["source"], **report}
+        return
+
+    original_overflow = template["original_overflow"]
+    del template
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_batch_worker,
+        initargs=(pptx_file, original_overflow),
+    ) as executor:
+        pending = set()
+        for job in jobs_iter:
+            if "error" in job:
+                yield failed_report(job)
+                continue
+            # Keep a few jobs per worker queued without reading the whole batch
+            if len(pending) >= jobs * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(_fill_batch_job, job))
+
+        for future in as_completed(pending):
+            yield future.result()
 
 
 def main():
     """Main entry point for command-line usage."""
-    if len(sys.argv) != 4:
-        print(__doc__)
-        sys.exit(1)
-
-    input_pptx = Path(sys.argv[1])
-    replacements_json = Path(sys.argv[2])
-    output_pptx = Path(sys.argv[3])
+    parser = argparse.ArgumentParser(
+        description="Apply text replacements to PowerPoint presentation.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python replace.py input.pptx replacements.json output.pptx
+
+  python replace.py input.pptx replacements.json output.pptx --inventory inventory.json
+    Reuses the overflow measurements saved by inventory.py for input.pptx
+    instead of measuring every shape again
+
+  python replace.py template.pptx --batch replacements/ --output-dir decks/ --jobs 4
+    Fills the template once per replacement file in replacements/, saving
+    decks/<name>.pptx for each
+
+  python replace.py template.pptx --batch decks.jsonl --output-dir decks/ --jobs 4
+    Same, reading one {"output": "name.pptx", "replacements": {...}} record
+    per line
+
+With --batch, prints one JSON report per line for each deck (in completion
+order) with its status, errors, overflow errors and warnings. Decks with any
+issue are not saved.
+        """,
+    )
+    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
+    parser.add_argument(
+        "replacements", nargs="?", help="Replacements file (.json or .jsonl)"
+    )
+    parser.add_argument("output", nargs="?", help="Output PowerPoint file (.pptx)")
+    parser.add_argument(
+        "--inventory",
+        help="Inventory saved by inventory.py for the same input file",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR_GLOB_OR_JSONL",
+        help="Fill the template from every replacement file in a directory or "
+        "matching a glob, or from each record of a .jsonl manifest",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory for decks written with --batch (default: current directory)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes with --batch (default: 1)",
+    )
+    args = parser.parse_args()
+
+    if args.batch is None and (args.replacements is None or args.output is None):
+        parser.error("give replacements and output files, or --batch")
+    if args.batch is not None and args.replacements is not None:
+        parser.error("give either replacements and output files or --batch, not both")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    input_pptx = Path(args.input)
 
     if not input_pptx.exists():
         print(f"Error: Input file '{input_pptx}' not found")
         sys.exit(1)
 
+    if args.inventory and not Path(args.inventory).exists():
+        print(f"Error: Inventory file '{args.inventory}' not found")
+        sys.exit(1)
+
+    if args.batch is not None:
+        start_time = time.perf_counter()
+        total = succeeded = 0
+        jobs_iter = iter_batch_jobs(args.batch, Path(args.output_dir))
+        for report in fill_batch(str(input_pptx), jobs_iter, args.jobs, args.inventory):
+            total += 1
+            succeeded += report["status"] == "success"
+            print(json.dumps(report, ensure_ascii=False), flush=True)
+
+        elapsed = time.perf_counter() - start_time
+        print(
+            f"Filled {succeeded} of {total} decks in {elapsed:.1f}s "
+            f"({total / max(elapsed, 1e-9):.2f} decks/s)",
+            file=sys.stderr,
+        )
+        sys.exit(0 if succeeded == total else 1)
+
+    replacements_json = Path(args.replacements)
+    output_pptx = Path(args.output)
+
     if not replacements_json.exists():
         print(f"Error: Replacements JSON file '{replacements_json}' not found")
         sys.exit(1)
 
     try:
-        apply_replacements(str(input_pptx), str(replacements_json), str(output_pptx))
+        apply_replacements(
+            str(input_pptx), str(replacements_json), str(output_pptx), args.inventory
+        )
     except Exception as e:
         print(f"Error applying replacements: {e}")
         import traceback
@@ -18,8 +18,12 @@ Grid limits by column count:
 - 5 cols: max 30 slides per grid (5×6) [default]
 - 6 cols: max 42 slides per grid (6×7)
 
+Rendered slides are cached by content hash, so re-running after editing a
+few slides only renders those slides again.
+
 Usage:
     python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+                        [--draft] [--jobs N] [--cache-dir DIR] [--no-cache]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,17 +42,30 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+    python thumbnail.py large-deck.pptx preview --draft
+    # Draws layout previews with PIL in well under a second, no LibreOffice needed
 """
 
 import argparse
+import hashlib
+import json
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from inventory import extract_text_inventory
+from inventory import compute_file_hash, extract_text_inventory
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+# The soffice pool client is shared with the ooxml scripts
+sys.path.append(str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
+import soffice_pool  # noqa: E402
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
@@ -56,6 +73,17 @@ CONVERSION_DPI = 100  # DPI for PDF to image conversion
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
+RENDER_CACHE_DIR = Path(tempfile.gettempdir()) / "pptx-thumbnails"  # Rendered slides
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)  # Parallel pdftoppm processes
+
+# Relationships that do not affect how a slide renders
+UNRENDERED_RELATIONSHIPS = {RT.NOTES_SLIDE, RT.SLIDE}
+
+# Draft rendering constants
+DRAFT_WIDTH = 640  # Width of draft slide images in pixels
+PML_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+DML_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+DRAFT_SHAPE_TAGS = {"sp", "pic", "graphicFrame", "grpSp", "cxnSp"}
 
 # Grid layout constants
 GRID_PADDING = 20  # Padding between thumbnails
@@ -86,6 +114,30 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--draft",
+        action="store_true",
+        help="Draw low-fidelity previews (shape boxes, text frames, pictures, "
+        "placeholders) with PIL instead of rendering with LibreOffice",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of parallel pdftoppm processes (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(RENDER_CACHE_DIR),
+        help="Directory of rendered slides, thumbnail tiles and placeholder "
+        "regions reused for unchanged slides "
+        f"(default: {RENDER_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every slide and thumbnail without reading or writing the cache",
+    )
 
     args = parser.parse_args()
 
@@ -105,6 +157,8 @@ def main():
 
     print(f"Processing: {args.input}")
 
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
+
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
             # Get placeholder regions if outlining is enabled
@@ -113,13 +167,19 @@ def main():
             if args.outline_placeholders:
                 print("Extracting placeholder regions...")
                 placeholder_regions, slide_dimensions = get_placeholder_regions(
-                    input_path
+                    input_path, cache_dir
                 )
                 if placeholder_regions:
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
             # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
+            if args.draft:
+                print("Rendering draft previews...")
+                slide_images = render_draft_images(input_path, Path(temp_dir))
+            else:
+                slide_images = convert_to_images(
+                    input_path, Path(temp_dir), CONVERSION_DPI, cache_dir, args.jobs
+                )
             if not slide_images:
                 print("Error: No slides found")
                 sys.exit(1)
@@ -134,6 +194,7 @@ def main():
                 output_path,
                 placeholder_regions,
                 slide_dimensions,
+                cache_dir,
             )
 
             # Print saved files
@@ -156,16 +217,34 @@ def create_hidden_slide_placeholder(size):
     return img
 
 
-def get_placeholder_regions(pptx_path):
+def get_placeholder_regions(pptx_path, cache_dir=None):
     """Extract ALL text regions from the presentation.
 
     Returns a tuple of (placeholder_regions, slide_dimensions).
     text_regions is a dict mapping slide indices to lists of text regions.
     Each region is a dict with 'left', 'top', 'width', 'height' in inches.
     slide_dimensions is a tuple of (width_inches, height_inches).
+
+    With a cache_dir, results are stored there under the file's content hash
+    and reused while the presentation is unchanged.
     """
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = (
+            Path(cache_dir) / "regions" / f"{compute_file_hash(pptx_path)}.json"
+        )
+        if cache_path.exists():
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            placeholder_regions = {
+                int(slide_idx): regions
+                for slide_idx, regions in cached["placeholder_regions"].items()
+            }
+            return placeholder_regions, tuple(cached["slide_dimensions"])
+
     prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
+    # Only positions are needed, so skip the text measurement
+    inventory = extract_text_inventory(pptx_path, prs, measure=False)
     placeholder_regions = {}
 
     # Get actual slide dimensions in inches (EMU to inches conversion)
@@ -191,11 +270,108 @@ def get_placeholder_regions(pptx_path):
         if regions:
             placeholder_regions[slide_idx] = regions
 
-    return placeholder_regions, (slide_width_inches, slide_height_inches)
+    slide_dimensions = (slide_width_inches, slide_height_inches)
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cached = {
+            "placeholder_regions": placeholder_regions,
+            "slide_dimensions": slide_dimensions,
+        }
+        partial_path = cache_path.with_suffix(".part")
+        with open(partial_path, "w", encoding="utf-8") as f:
+            json.dump(cached, f)
+        os.replace(partial_path, cache_path)
+
+    return placeholder_regions, slide_dimensions
+
+
+def slide_content_hashes(prs):
+    """Return one content hash per slide, covering everything it renders from.
+
+    Each hash covers the slide part and every part it references (layout,
+    master, theme, media, charts, ...) plus ppt/presentation.xml, which holds
+    the slide size and the default text styles. Notes and links to other
+    slides are left out because they do not change the slide's image. Slides
+    that show a slide number field also depend on their position.
+    """
+    part_digests = {}
+    presentation_digest = hashlib.sha256(prs.part.blob).hexdigest()
+    hashes = []
+
+    for slide_idx, slide in enumerate(prs.slides):
+        # Collect the digests of all parts reachable from this slide
+        closure = {}
+        stack = [slide.part]
+        while stack:
+            part = stack.pop()
+            partname = str(part.partname)
+            if partname in closure:
+                continue
+            if partname not in part_digests:
+                part_digests[partname] = hashlib.sha256(part.blob).hexdigest()
+            closure[partname] = part_digests[partname]
+            for rel in part.rels.values():
+                if rel.is_external or rel.reltype in UNRENDERED_RELATIONSHIPS:
+                    continue
+                stack.append(rel.target_part)
+
+        digest = hashlib.sha256(f"presentation={presentation_digest};".encode())
+        for partname, part_digest in sorted(closure.items()):
+            digest.update(f"{partname}={part_digest};".encode())
+        if b'type="slidenum"' in slide.part.blob:
+            digest.update(f"position={slide_idx}".encode())
+        hashes.append(digest.hexdigest())
+
+    return hashes
+
+
+def rasterize_pdf(pdf_path, page_count, output_prefix, dpi, jobs=1):
+    """Rasterize a PDF to JPEGs, splitting the page range across pdftoppm processes.
+
+    Images are named {output_prefix}-N.jpg by pdftoppm, numbered by page.
+    """
+    jobs = max(1, min(jobs, page_count))
+    pages_per_job = -(-page_count // jobs)  # Ceiling division
+    page_ranges = [
+        (first, min(first + pages_per_job - 1, page_count))
+        for first in range(1, page_count + 1, pages_per_job)
+    ]
+
+    def run(page_range):
+        first, last = page_range
+        return subprocess.run(
+            [
+                "pdftoppm",
+                "-jpeg",
+                "-r",
+                str(dpi),
+                "-f",
+                str(first),
+                "-l",
+                str(last),
+                str(pdf_path),
+                str(output_prefix),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(run, page_ranges))
+    if any(result.returncode != 0 for result in results):
+        raise RuntimeError("Image conversion failed")
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def convert_to_images(
+    pptx_path, temp_dir, dpi, cache_dir=RENDER_CACHE_DIR, jobs=DEFAULT_JOBS
+):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    With a cache_dir, rendered slides are kept there under their content hash
+    (see slide_content_hashes) and reused on later runs, so only new or changed
+    slides go through soffice and pdftoppm. Pass cache_dir=None to render
+    every slide.
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
@@ -212,45 +388,78 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
-    # Convert to PDF
-    print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
-
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
-    result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
-
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+    # Look up visible slides in the render cache
+    visible_slides = [n for n in range(1, total_slides + 1) if n not in hidden_slides]
+    slide_images = {}
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_paths = {
+            slide_num: cache_dir / f"{content_hash}-{dpi}.jpg"
+            for slide_num, content_hash in enumerate(slide_content_hashes(prs), 1)
+        }
+        for slide_num in visible_slides:
+            if cache_paths[slide_num].exists():
+                slide_images[slide_num] = cache_paths[slide_num]
+        if slide_images:
+            print(f"Reusing {len(slide_images)} cached slide image(s)")
+
+    to_render = [n for n in visible_slides if n not in slide_images]
+    if to_render:
+        render_path = pptx_path
+        if len(to_render) < len(visible_slides):
+            # Hide cached slides so soffice only exports the others; hiding
+            # keeps slide numbers unchanged, unlike deleting slides
+            for slide_num, slide in enumerate(prs.slides, 1):
+                if slide_num not in to_render:
+                    slide.element.set("show", "0")
+            render_path = temp_dir / f"render-{pptx_path.stem}.pptx"
+            prs.save(str(render_path))
+
+        pdf_path = temp_dir / f"{render_path.stem}.pdf"
+
+        # Convert to PDF, using a warm soffice from the pool when one is running
+        print(f"Converting {len(to_render)} slide(s) to PDF...")
+        if soffice_pool.is_running():
+            converted = soffice_pool.convert(render_path, "pdf", temp_dir)["ok"]
+        else:
+            result = subprocess.run(
+                [
+                    "soffice",
+                    "--headless",
+                    "--convert-to",
+                    "pdf",
+                    "--outdir",
+                    str(temp_dir),
+                    str(render_path),
+                ],
+                capture_output=True,
+                text=True,
+            )
+            converted = result.returncode == 0
+        if not converted or not pdf_path.exists():
+            raise RuntimeError("PDF conversion failed")
+
+        # Convert PDF to images
+        print(f"Converting to images at {dpi} DPI...")
+        rasterize_pdf(pdf_path, len(to_render), temp_dir / "slide", dpi, jobs)
+
+        rendered_images = sorted(temp_dir.glob("slide-*.jpg"))
+        for slide_num, image_path in zip(to_render, rendered_images):
+            if cache_dir is not None:
+                # Write under a temporary name first so readers never see a partial file
+                partial_path = cache_paths[slide_num].with_suffix(".part")
+                shutil.copyfile(image_path, partial_path)
+                os.replace(partial_path, cache_paths[slide_num])
+                image_path = cache_paths[slide_num]
+            slide_images[slide_num] = image_path
 
     # Create full list with placeholders for hidden slides
     all_images = []
-    visible_idx = 0
 
     # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
+    if slide_images:
+        with Image.open(slide_images[min(slide_images)]) as img:
             placeholder_size = img.size
     else:
         placeholder_size = (1920, 1080)
@@ -262,11 +471,229 @@ def convert_to_images(pptx_path, temp_dir, dpi):
             placeholder_img = create_hidden_slide_placeholder(placeholder_size)
             placeholder_img.save(placeholder_path, "JPEG")
             all_images.append(placeholder_path)
-        else:
+        elif slide_num in slide_images:
             # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
+            all_images.append(slide_images[slide_num])
+
+    return all_images
+
+
+def _placeholder_element(elem):
+    """Return the <p:ph> element of a shape element, or None."""
+    if not len(elem):
+        return None
+    # The first child is the non-visual properties (nvSpPr, nvPicPr, ...)
+    return elem[0].find(f"{PML_NS}nvPr/{PML_NS}ph")
+
+
+def _shape_box(elem):
+    """Return (x, y, cx, cy) in EMUs from a shape element's own xfrm, or None."""
+    tag = elem.tag.rsplit("}", 1)[-1]
+    if tag == "graphicFrame":
+        xfrm = elem.find(f"{PML_NS}xfrm")
+    elif tag == "grpSp":
+        xfrm = elem.find(f"{PML_NS}grpSpPr/{DML_NS}xfrm")
+    else:
+        xfrm = elem.find(f"{PML_NS}spPr/{DML_NS}xfrm")
+    if xfrm is None:
+        return None
+    off = xfrm.find(f"{DML_NS}off")
+    ext = xfrm.find(f"{DML_NS}ext")
+    if off is None or ext is None:
+        return None
+    return (
+        int(off.get("x", 0)),
+        int(off.get("y", 0)),
+        int(ext.get("cx", 0)),
+        int(ext.get("cy", 0)),
+    )
+
+
+def _inherited_box(ph, boxes, by_type_first=False):
+    """Find the box a placeholder inherits from a layout or master box map."""
+    if ph is None or not boxes:
+        return None
+    keys = [("idx", ph.get("idx", "0")), ("type", ph.get("type", "body"))]
+    if by_type_first:
+        keys.reverse()
+    for key in keys:
+        if key in boxes:
+            return boxes[key]
+    return None
+
+
+def _placeholder_boxes(part, cache):
+    """Map placeholder idx and type to boxes for a layout or master part.
+
+    Layout placeholders without their own position inherit it from the master.
+    Results are cached per part, since every slide using a layout needs them.
+    """
+    if part.partname in cache:
+        return cache[part.partname]
+
+    master_boxes = None
+    for rel in part.rels.values():
+        if not rel.is_external and rel.reltype == RT.SLIDE_MASTER:
+            master_boxes = _placeholder_boxes(rel.target_part, cache)
+
+    boxes = {}
+    for elem in part._element.find(f"{PML_NS}cSld/{PML_NS}spTree"):
+        ph = _placeholder_element(elem)
+        if ph is None:
+            continue
+        box = _shape_box(elem) or _inherited_box(ph, master_boxes, by_type_first=True)
+        if box:
+            boxes.setdefault(("idx", ph.get("idx", "0")), box)
+            boxes.setdefault(("type", ph.get("type", "body")), box)
+
+    cache[part.partname] = boxes
+    return boxes
+
+
+def _draw_text(draw, rect, txBody, line_height):
+    """Draw a text body as greeked lines: one bar per wrapped line of text.
+
+    Glyph rendering costs more than the rest of a draft slide put together, and
+    at thumbnail size the bars show how much of the frame the text fills.
+    """
+    left, top, right, bottom = rect
+    bar_height = max(1, line_height // 2)
+    char_width = max(1.0, line_height * 0.45)
+    chars_per_line = max(1, int((right - left - 4) / char_width))
+
+    y = top + 2
+    for paragraph in txBody.iter(f"{DML_NS}p"):
+        length = sum(len(t.text or "") for t in paragraph.iter(f"{DML_NS}t"))
+        while True:
+            if y + bar_height > bottom:
+                return
+            if length:
+                chars = min(length, chars_per_line)
+                draw.rectangle(
+                    (left + 2, y, left + 2 + chars * char_width, y + bar_height),
+                    fill="#7F7F7F",
+                )
+                length -= chars
+            y += line_height
+            if length <= 0:
+                break
+
+
+def render_draft_slide(slide, slide_size, image_size, placeholder_cache):
+    """Draw a low-fidelity preview of one slide straight from its shape XML.
+
+    Pictures are grey boxes with diagonals, tables and charts light blue boxes,
+    other shapes their outline (filled if they have a solid RGB fill), text
+    frames a blue outline with greeked text, and placeholders a red outline.
+    Placeholders without their own position use the layout's, as PowerPoint does.
+    """
+    img = Image.new("RGB", image_size, "white")
+    draw = ImageDraw.Draw(img)
+    scale = image_size[0] / slide_size[0]
+    line_width = max(1, image_size[0] // 320)
+    line_height = max(3, image_size[1] // 40)
+    layout_boxes = _placeholder_boxes(slide.slide_layout.part, placeholder_cache)
+
+    def walk(container, transform):
+        for elem in container:
+            tag = elem.tag.rsplit("}", 1)[-1]
+            if tag not in DRAFT_SHAPE_TAGS:
+                continue
+            ph = _placeholder_element(elem)
+            box = _shape_box(elem) or _inherited_box(ph, layout_boxes)
+            if not box:
+                continue
+            x, y, cx, cy = transform(box)
+
+            if tag == "grpSp":
+                # Map child coordinates through the group's child offset/extent
+                xfrm = elem.find(f"{PML_NS}grpSpPr/{DML_NS}xfrm")
+                ch_off = xfrm.find(f"{DML_NS}chOff")
+                ch_ext = xfrm.find(f"{DML_NS}chExt")
+                if ch_off is None or ch_ext is None:
+                    ch_x, ch_y, ch_cx, ch_cy = box
+                else:
+                    ch_x, ch_y = int(ch_off.get("x", 0)), int(ch_off.get("y", 0))
+                    ch_cx, ch_cy = int(ch_ext.get("cx", 0)), int(ch_ext.get("cy", 0))
+                sx = cx / ch_cx if ch_cx else 1.0
+                sy = cy / ch_cy if ch_cy else 1.0
+
+                def child_transform(b, x=x, y=y, ch_x=ch_x, ch_y=ch_y, sx=sx, sy=sy):
+                    return (
+                        x + (b[0] - ch_x) * sx,
+                        y + (b[1] - ch_y) * sy,
+                        b[2] * sx,
+                        b[3] * sy,
+                    )
+
+                walk(elem, child_transform)
+                continue
+
+            rect = (x * scale, y * scale, (x + cx) * scale, (y + cy) * scale)
+            if rect[2] - rect[0] < 1 or rect[3] - rect[1] < 1:
+                # Lines and empty shapes: only a connector is worth drawing
+                if tag == "cxnSp":
+                    draw.line(rect, fill="#7F7F7F", width=line_width)
+                continue
+
+            if tag == "pic":
+                draw.rectangle(
+                    rect, fill="#D9D9D9", outline="#A6A6A6", width=line_width
+                )
+                draw.line(rect, fill="#A6A6A6", width=line_width)
+                draw.line(
+                    (rect[0], rect[3], rect[2], rect[1]),
+                    fill="#A6A6A6",
+                    width=line_width,
+                )
+            elif tag == "graphicFrame":
+                draw.rectangle(
+                    rect, fill="#DDEBF7", outline="#9BC2E6", width=line_width
+                )
+            elif tag == "cxnSp":
+                draw.line(rect, fill="#7F7F7F", width=line_width)
+            else:
+                fill = elem.find(f"{PML_NS}spPr/{DML_NS}solidFill/{DML_NS}srgbClr")
+                draw.rectangle(
+                    rect,
+                    fill=f"#{fill.get('val')}" if fill is not None else None,
+                    outline="#BFBFBF",
+                    width=line_width,
+                )
+
+            txBody = elem.find(f"{PML_NS}txBody")
+            if txBody is not None and any(t.text for t in txBody.iter(f"{DML_NS}t")):
+                draw.rectangle(rect, outline="#2F5597", width=line_width)
+                _draw_text(draw, rect, txBody, line_height)
+
+            if ph is not None:
+                draw.rectangle(rect, outline="#E00000", width=line_width)
+
+    walk(slide.shapes._spTree, lambda box: box)
+    return img
+
+
+def render_draft_images(pptx_path, temp_dir, width=DRAFT_WIDTH):
+    """Render low-fidelity slide previews with PIL instead of LibreOffice.
+
+    Hidden slides get the same placeholder image as in convert_to_images.
+    """
+    prs = Presentation(str(pptx_path))
+    slide_size = (prs.slide_width or 9144000, prs.slide_height or 5143500)
+    image_size = (width, round(width * slide_size[1] / slide_size[0]))
+
+    placeholder_cache = {}
+    all_images = []
+    for slide_num, slide in enumerate(prs.slides, 1):
+        if slide.element.get("show") == "0":
+            image_path = temp_dir / f"hidden-{slide_num:03d}.bmp"
+            img = create_hidden_slide_placeholder(image_size)
+        else:
+            image_path = temp_dir / f"draft-{slide_num:03d}.bmp"
+            img = render_draft_slide(slide, slide_size, image_size, placeholder_cache)
+        # Uncompressed: the images only live until the grids are composed
+        img.save(image_path, "BMP")
+        all_images.append(image_path)
 
     return all_images
 
@@ -278,8 +705,12 @@ def create_grids(
     output_path,
     placeholder_regions=None,
     slide_dimensions=None,
+    tile_cache_dir=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
+    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid.
+
+    With a tile_cache_dir, downscaled thumbnails are cached there (see get_tile).
+    """
     # Maximum images per grid is cols × (cols + 1) for better proportions
     max_images_per_grid = cols * (cols + 1)
     grid_files = []
@@ -297,7 +728,13 @@ def create_grids(
 
         # Create grid for this chunk
         grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
+            chunk_images,
+            cols,
+            width,
+            start_idx,
+            placeholder_regions,
+            slide_dimensions,
+            tile_cache_dir,
         )
 
         # Generate output filename
@@ -318,6 +755,93 @@ def create_grids(
     return grid_files
 
 
+def make_tile(img_path, width, height, regions=None, slide_dimensions=None):
+    """Downscale one slide image to fit width×height, outlining regions if given."""
+    with Image.open(img_path) as img:
+        # Get original dimensions before thumbnail
+        orig_w, orig_h = img.size
+
+        # Apply placeholder outlines if enabled
+        if regions:
+            # Convert to RGBA for transparency support
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
+
+            # Calculate scale factors using actual slide dimensions
+            if slide_dimensions:
+                slide_width_inches, slide_height_inches = slide_dimensions
+            else:
+                # Fallback: estimate from image size at CONVERSION_DPI
+                slide_width_inches = orig_w / CONVERSION_DPI
+                slide_height_inches = orig_h / CONVERSION_DPI
+
+            x_scale = orig_w / slide_width_inches
+            y_scale = orig_h / slide_height_inches
+
+            # Create a highlight overlay
+            overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
+            overlay_draw = ImageDraw.Draw(overlay)
+
+            # Highlight each placeholder region
+            for region in regions:
+                # Convert from inches to pixels in the original image
+                px_left = int(region["left"] * x_scale)
+                px_top = int(region["top"] * y_scale)
+                px_width = int(region["width"] * x_scale)
+                px_height = int(region["height"] * y_scale)
+
+                # Draw highlight outline with red color and thick stroke
+                # Using a bright red outline instead of fill
+                stroke_width = max(
+                    5, min(orig_w, orig_h) // 150
+                )  # Thicker proportional stroke width
+                overlay_draw.rectangle(
+                    [(px_left, px_top), (px_left + px_width, px_top + px_height)],
+                    outline=(255, 0, 0, 255),  # Bright red, fully opaque
+                    width=stroke_width,
+                )
+
+            # Composite the overlay onto the image using alpha blending
+            img = Image.alpha_composite(img, overlay)
+            # Convert back to RGB for JPEG saving
+            img = img.convert("RGB")
+
+        img.thumbnail((width, height), Image.Resampling.LANCZOS)
+        img.load()
+        return img
+
+
+def get_tile(
+    img_path, width, height, regions=None, slide_dimensions=None, cache_dir=None
+):
+    """Return the thumbnail tile for one slide image, using the tile cache if given.
+
+    Tiles are stored losslessly under a hash of the image bytes, the target
+    size and any outlined regions, so grids with other column counts or
+    unchanged slides never decode the full-resolution image again.
+    """
+    if cache_dir is None:
+        return make_tile(img_path, width, height, regions, slide_dimensions)
+
+    key = hashlib.sha256(Path(img_path).read_bytes())
+    key.update(f"{width}x{height}".encode())
+    if regions:
+        key.update(json.dumps([regions, slide_dimensions]).encode())
+    tile_path = Path(cache_dir) / "tiles" / f"{key.hexdigest()}.png"
+
+    if tile_path.exists():
+        tile = Image.open(tile_path)
+        tile.load()
+        return tile
+
+    tile = make_tile(img_path, width, height, regions, slide_dimensions)
+    tile_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = tile_path.with_suffix(".part")
+    tile.save(partial_path, "PNG", compress_level=1)
+    os.replace(partial_path, tile_path)
+    return tile
+
+
 def create_grid(
     image_paths,
     cols,
@@ -325,6 +849,7 @@ def create_grid(
     start_slide_num=0,
     placeholder_regions=None,
     slide_dimensions=None,
+    tile_cache_dir=None,
 ):
     """Create thumbnail grid from slide images with optional placeholder outlining."""
     font_size = int(width * FONT_SIZE_RATIO)
@@ -374,74 +899,28 @@ def create_grid(
         # Add thumbnail below label with proportional spacing
         y_thumbnail = y_base + label_padding + font_size + label_padding
 
-        with Image.open(img_path) as img:
-            # Get original dimensions before thumbnail
-            orig_w, orig_h = img.size
-
-            # Apply placeholder outlines if enabled
-            if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
-
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
-
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-            w, h = img.size
-            tx = x + (width - w) // 2
-            ty = y_thumbnail + (height - h) // 2
-            grid.paste(img, (tx, ty))
+        regions = None
+        if placeholder_regions:
+            regions = placeholder_regions.get(start_slide_num + i)
+        tile = get_tile(
+            img_path, width, height, regions, slide_dimensions, tile_cache_dir
+        )
 
-            # Add border
-            if BORDER_WIDTH > 0:
-                draw.rectangle(
-                    [
-                        (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
-                        (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
-                    ],
-                    outline="gray",
-                    width=BORDER_WIDTH,
-                )
+        w, h = tile.size
+        tx = x + (width - w) // 2
+        ty = y_thumbnail + (height - h) // 2
+        grid.paste(tile, (tx, ty))
+
+        # Add border
+        if BORDER_WIDTH > 0:
+            draw.rectangle(
+                [
+                    (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
+                    (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
+                ],
+                outline="gray",
+                width=BORDER_WIDTH,
+            )
 
     return grid
 
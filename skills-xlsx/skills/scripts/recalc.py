@@ -4,18 +4,56 @@ Excel Formula Recalculation Script
 Recalculates all formulas in an Excel file using LibreOffice
 """
 
+import argparse
+import glob
 import json
+import queue
+import signal
 import sys
 import subprocess
 import os
 import platform
+import posixpath
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from openpyxl import load_workbook
+from openpyxl.cell.text import Text
+from openpyxl.reader.strings import read_string_table
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.xml.constants import (
+    ARC_ROOT_RELS, ARC_WORKBOOK, PKG_REL_NS, REL_NS, SHEET_MAIN_NS
+)
+from openpyxl.xml.functions import fromstring, iterparse
 
+import soffice_pool
 
-def setup_libreoffice_macro():
-    """Setup LibreOffice macro for recalculation if not already configured"""
-    if platform.system() == 'Darwin':
+EXCEL_ERRORS = ['#VALUE!', '#DIV/0!', '#REF!', '#NAME?', '#NULL!', '#NUM!', '#N/A']
+
+# Worksheet XML tags read by the scan
+SHEET_DATA_TAG = f'{{{SHEET_MAIN_NS}}}sheetData'
+ROW_TAG = f'{{{SHEET_MAIN_NS}}}row'
+CELL_TAG = f'{{{SHEET_MAIN_NS}}}c'
+VALUE_TAG = f'{{{SHEET_MAIN_NS}}}v'
+FORMULA_TAG = f'{{{SHEET_MAIN_NS}}}f'
+INLINE_STRING_TAG = f'{{{SHEET_MAIN_NS}}}is'
+
+# Relationship types that lead from the package to the parts the scan reads
+OFFICE_DOCUMENT_REL = f'{REL_NS}/officeDocument'
+WORKSHEET_REL = f'{REL_NS}/worksheet'
+SHARED_STRINGS_REL = f'{REL_NS}/sharedStrings'
+
+def setup_libreoffice_macro(profile_dir=None):
+    """
+    Setup LibreOffice macro for recalculation if not already configured
+    
+    Args:
+        profile_dir: LibreOffice user profile to set up instead of the default one
+    """
+    if profile_dir is not None:
+        macro_dir = os.path.join(profile_dir, 'user', 'basic', 'Standard')
+    elif platform.system() == 'Darwin':
         macro_dir = os.path.expanduser('~/Library/Application Support/LibreOffice/4/user/basic/Standard')
     else:
         macro_dir = os.path.expanduser('~/.config/libreoffice/4/user/basic/Standard')
@@ -28,7 +66,7 @@ def setup_libreoffice_macro():
                 return True
     
     if not os.path.exists(macro_dir):
-        subprocess.run(['soffice', '--headless', '--terminate_after_init'], 
+        subprocess.run(['soffice', '--headless', '--terminate_after_init'] + profile_args(profile_dir),
                       capture_output=True, timeout=10)
         os.makedirs(macro_dir, exist_ok=True)
     
@@ -50,13 +88,22 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+def profile_args(profile_dir):
+    """soffice arguments selecting a user profile (none for the default profile)"""
+    if profile_dir is None:
+        return []
+    return [f'-env:UserInstallation={Path(profile_dir).absolute().as_uri()}']
+
+
+def recalc(filename, timeout=30, profile_dir=None):
     """
     Recalculate formulas in Excel file and report any errors
     
     Args:
         filename: Path to Excel file
         timeout: Maximum time to wait for recalculation (seconds)
+        profile_dir: Isolated LibreOffice user profile, so several recalcs can
+            run at once (default: the user's profile)
     
     Returns:
         dict with error locations and counts
@@ -66,60 +113,100 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
-    if not setup_libreoffice_macro():
+    # Use a warm soffice from the pool when one is running
+    if soffice_pool.is_running():
+        response = soffice_pool.recalc(abs_path, timeout)
+        if response.get('timed_out'):
+            return timed_out(timeout)
+        if not response['ok']:
+            return {'error': response['error']}
+        return scan_workbook(filename)
+    
+    if not setup_libreoffice_macro(profile_dir):
         return {'error': 'Failed to setup LibreOffice macro'}
     
     cmd = [
-        'soffice', '--headless', '--norestore',
+        'soffice', '--headless', '--norestore', *profile_args(profile_dir),
         'vnd.sun.star.script:Standard.Module1.RecalculateAndSave?language=Basic&location=application',
         abs_path
     ]
     
-    # Handle timeout command differences between Linux and macOS
-    if platform.system() != 'Windows':
-        timeout_cmd = 'timeout' if platform.system() == 'Linux' else None
-        if platform.system() == 'Darwin':
-            # Check if gtimeout is available on macOS
-            try:
-                subprocess.run(['gtimeout', '--version'], capture_output=True, timeout=1, check=False)
-                timeout_cmd = 'gtimeout'
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-        
-        if timeout_cmd:
-            cmd = [timeout_cmd, str(timeout)] + cmd
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # soffice runs in its own process group (job object tree on Windows), so a
+    # timeout kills the soffice.bin it spawns too and frees the profile
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        start_new_session=platform.system() != 'Windows'
+    )
+    try:
+        _, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_process_tree(process)
+        process.communicate()
+        return timed_out(timeout)
     
-    if result.returncode != 0 and result.returncode != 124:  # 124 is timeout exit code
-        error_msg = result.stderr or 'Unknown error during recalculation'
+    if process.returncode != 0:
+        error_msg = stderr or 'Unknown error during recalculation'
         if 'Module1' in error_msg or 'RecalculateAndSave' not in error_msg:
             return {'error': 'LibreOffice macro not configured properly'}
         else:
             return {'error': error_msg}
     
+    return scan_workbook(filename)
+
+
+def timed_out(timeout):
+    """Result for a workbook whose recalculation did not finish in time"""
+    return {'error': f'Timed out after {timeout}s', 'timed_out': True}
+
+
+def kill_process_tree(process):
+    """Kill a process started by recalc() along with its children"""
+    if platform.system() == 'Windows':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.kill()
+
+
+def scan_workbook(filename):
+    """
+    Report Excel errors and formula counts of a recalculated workbook
+    
+    Every worksheet's XML is streamed once, collecting error locations from the
+    cached values and counting formulas at the same time.
+    
+    Args:
+        filename: Path to Excel file
+    
+    Returns:
+        dict with error locations and counts, and scan time per sheet
+    """
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
-        wb = load_workbook(filename, data_only=True)
-        
-        excel_errors = ['#VALUE!', '#DIV/0!', '#REF!', '#NAME?', '#NULL!', '#NUM!', '#N/A']
-        error_details = {err: [] for err in excel_errors}
+        error_details = {err: [] for err in EXCEL_ERRORS}
         total_errors = 0
+        formula_count = 0
+        sheet_scan_seconds = {}
         
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            # Check ALL rows and columns - no limits
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value is not None and isinstance(cell.value, str):
-                        for err in excel_errors:
-                            if err in cell.value:
-                                location = f"{sheet_name}!{cell.coordinate}"
-                                error_details[err].append(location)
-                                total_errors += 1
-                                break
-        
-        wb.close()
+        with zipfile.ZipFile(filename) as archive:
+            sheets, shared_strings = read_workbook_parts(archive)
+            for sheet_name, sheet_path in sheets:
+                start = time.perf_counter()
+                with archive.open(sheet_path) as source:
+                    # Check ALL rows and columns - no limits
+                    for coordinate, value, is_formula in iter_cells(source, shared_strings):
+                        if is_formula:
+                            formula_count += 1
+                        if value is not None:
+                            for err in EXCEL_ERRORS:
+                                if err in value:
+                                    error_details[err].append(f"{sheet_name}!{coordinate}")
+                                    total_errors += 1
+                                    break
+                sheet_scan_seconds[sheet_name] = round(time.perf_counter() - start, 3)
         
         # Build result summary
         result = {
@@ -136,18 +223,9 @@ def recalc(filename, timeout=30):
                     'locations': locations[:20]  # Show up to 20 locations
                 }
         
-        # Add formula count for context - also check ALL cells
-        wb_formulas = load_workbook(filename, data_only=False)
-        formula_count = 0
-        for sheet_name in wb_formulas.sheetnames:
-            ws = wb_formulas[sheet_name]
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
-                        formula_count += 1
-        wb_formulas.close()
-        
+        # Add formula count for context
         result['total_formulas'] = formula_count
+        result['sheet_scan_seconds'] = sheet_scan_seconds
         
         return result
         
@@ -155,24 +233,234 @@ def recalc(filename, timeout=30):
         return {'error': str(e)}
 
 
+def read_workbook_parts(archive):
+    """
+    Locate the worksheets and load the shared strings of an open workbook zip
+    
+    Part names come from the package relationships, the same way openpyxl
+    resolves them, so renamed or relocated parts are found as well.
+    
+    Args:
+        archive: zipfile.ZipFile of the workbook
+    
+    Returns:
+        ([(sheet title, worksheet part name)] in workbook order, shared strings)
+    """
+    workbook_path = ARC_WORKBOOK
+    for rel in read_relationships(archive, ARC_ROOT_RELS, ''):
+        if rel['type'] == OFFICE_DOCUMENT_REL:
+            workbook_path = rel['target']
+            break
+    
+    workbook_dir = posixpath.dirname(workbook_path)
+    rels_path = posixpath.join(workbook_dir, '_rels', posixpath.basename(workbook_path) + '.rels')
+    rels = {rel['id']: rel for rel in read_relationships(archive, rels_path, workbook_dir)}
+    
+    shared_strings = []
+    for rel in rels.values():
+        if rel['type'] == SHARED_STRINGS_REL and rel['target'] in archive.namelist():
+            with archive.open(rel['target']) as source:
+                shared_strings = read_string_table(source)
+            break
+    
+    # Chartsheets have no cells, so only worksheet relationships are kept
+    sheets = []
+    workbook = fromstring(archive.read(workbook_path))
+    for sheet in workbook.iter(f'{{{SHEET_MAIN_NS}}}sheet'):
+        rel = rels.get(sheet.get(f'{{{REL_NS}}}id'))
+        if rel is not None and rel['type'] == WORKSHEET_REL:
+            sheets.append((sheet.get('name'), rel['target']))
+    return sheets, shared_strings
+
+
+def read_relationships(archive, rels_path, base_dir):
+    """
+    Relationships of a package part, with targets resolved to part names
+    
+    Args:
+        archive: zipfile.ZipFile of the workbook
+        rels_path: Part name of the .rels file
+        base_dir: Directory that relative targets are resolved against
+    
+    Returns:
+        list of dicts with 'id', 'type' and 'target'; empty if rels_path is missing
+    """
+    if rels_path not in archive.namelist():
+        return []
+    relationships = []
+    for rel in fromstring(archive.read(rels_path)).iter(f'{{{PKG_REL_NS}}}Relationship'):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        if target.startswith('/'):
+            target = target.lstrip('/')
+        else:
+            target = posixpath.normpath(posixpath.join(base_dir, target))
+        relationships.append({'id': rel.get('Id'), 'type': rel.get('Type'), 'target': target})
+    return relationships
+
+
+def iter_cells(source, shared_strings):
+    """
+    Stream the cells of a worksheet XML file
+    
+    Args:
+        source: File object with the worksheet XML
+        shared_strings: The workbook's shared string table
+    
+    Yields:
+        (coordinate, value, is_formula) per cell, where value is the cell's
+        cached text (None unless it is a string or an error) and is_formula
+        tells whether the cell holds a formula, as openpyxl reports them
+    """
+    row_counter = 0
+    col_counter = 0
+    sheet_data = None
+    
+    for event, element in iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if element.tag == SHEET_DATA_TAG:
+                sheet_data = element
+            elif element.tag == ROW_TAG:
+                row_counter = int(element.get('r', row_counter + 1))
+                col_counter = 0
+            continue
+        
+        if element.tag == ROW_TAG:
+            # Rows are fully processed, drop them to keep memory flat
+            sheet_data.clear()
+            continue
+        if element.tag != CELL_TAG:
+            continue
+        
+        coordinate = element.get('r')
+        if coordinate:
+            col_counter = column_index_from_string(coordinate.rstrip('0123456789'))
+        else:
+            col_counter += 1
+            coordinate = f"{get_column_letter(col_counter)}{row_counter}"
+        
+        data_type = element.get('t', 'n')
+        if data_type == 'inlineStr':
+            inline = element.find(INLINE_STRING_TAG)
+            value = Text.from_tree(inline).content if inline is not None else None
+        else:
+            value = element.findtext(VALUE_TAG) or None
+            if value is not None:
+                if data_type == 's':
+                    value = shared_strings[int(value)]
+                elif data_type not in ('str', 'e'):
+                    value = None  # Numbers, booleans and dates are never errors
+        
+        formula = element.find(FORMULA_TAG)
+        if formula is not None:
+            # openpyxl reports array and data table formulas as objects, not '=' strings
+            is_formula = formula.get('t') not in ('array', 'dataTable')
+        else:
+            is_formula = bool(value) and value.startswith('=')
+        
+        yield coordinate, value, is_formula
+
+
+def find_workbooks(pattern):
+    """Excel files in a directory, or matching a glob pattern, in sorted order"""
+    if os.path.isdir(pattern):
+        paths = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+    else:
+        paths = glob.glob(pattern, recursive=True)
+    return sorted(
+        path for path in paths
+        if path.lower().endswith(('.xlsx', '.xlsm'))
+        and not os.path.basename(path).startswith('~$')  # Excel lock files
+    )
+
+
+def recalc_batch(filenames, jobs=2, timeout=30):
+    """
+    Recalculate many Excel files concurrently
+    
+    Each concurrent soffice gets its own profile directory, and a failing or
+    timed-out file only affects its own result.
+    
+    Args:
+        filenames: Paths to Excel files
+        jobs: Number of files to recalculate at once
+        timeout: Maximum time to wait for each recalculation (seconds)
+    
+    Yields:
+        dict per file, in completion order, with 'file' added to recalc()'s result
+    """
+    with tempfile.TemporaryDirectory(prefix='recalc-profiles-') as profiles_root:
+        # Each running job borrows a profile and returns it when done
+        profiles = queue.Queue()
+        for i in range(jobs):
+            profiles.put(os.path.join(profiles_root, f'profile-{i}'))
+        
+        def run(filename):
+            profile_dir = profiles.get()
+            try:
+                return recalc(filename, timeout, profile_dir)
+            except Exception as e:
+                return {'error': str(e)}
+            finally:
+                profiles.put(profile_dir)
+        
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(run, filename): filename for filename in filenames}
+            for future in as_completed(futures):
+                yield {'file': futures[future], **future.result()}
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python recalc.py <excel_file> [timeout_seconds]")
-        print("\nRecalculates all formulas in an Excel file using LibreOffice")
-        print("\nReturns JSON with error details:")
-        print("  - status: 'success' or 'errors_found'")
-        print("  - total_errors: Total number of Excel errors found")
-        print("  - total_formulas: Number of formulas in the file")
-        print("  - error_summary: Breakdown by error type with locations")
-        print("    - #VALUE!, #DIV/0!, #REF!, #NAME?, #NULL!, #NUM!, #N/A")
+    parser = argparse.ArgumentParser(
+        description='Recalculates all formulas in an Excel file using LibreOffice',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Returns JSON with error details:
+  - status: 'success' or 'errors_found'
+  - total_errors: Total number of Excel errors found
+  - total_formulas: Number of formulas in the file
+  - error_summary: Breakdown by error type with locations
+    - #VALUE!, #DIV/0!, #REF!, #NAME?, #NULL!, #NUM!, #N/A
+
+With --batch, prints one JSON object per line for each file, with a 'file' key.""",
+    )
+    parser.add_argument('excel_file', nargs='?', help='Excel file to recalculate')
+    parser.add_argument('timeout_seconds', nargs='?', type=int, default=30,
+                        help='Maximum time per recalculation (default: 30)')
+    parser.add_argument('--batch', metavar='DIR_OR_GLOB',
+                        help='Recalculate every .xlsx/.xlsm in a directory or matching a glob')
+    parser.add_argument('--jobs', type=int, default=2,
+                        help='Number of workbooks to recalculate at once with --batch (default: 2)')
+    parser.add_argument('--timeout', type=int,
+                        help='Maximum time per recalculation, for --batch (default: 30)')
+    args = parser.parse_args()
+    
+    if args.batch is None and args.excel_file is None:
+        parser.print_help()
         sys.exit(1)
     
-    filename = sys.argv[1]
-    timeout = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    timeout = args.timeout if args.timeout is not None else args.timeout_seconds
+    if timeout < 1:
+        parser.error('the timeout must be at least 1 second')
+    
+    if args.batch is None:
+        result = recalc(args.excel_file, timeout)
+        print(json.dumps(result, indent=2))
+        return
+    
+    if args.excel_file is not None:
+        parser.error('give either an excel_file or --batch, not both (use --timeout for batch mode)')
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    
+    filenames = find_workbooks(args.batch)
+    if not filenames:
+        print(f"No Excel files found for {args.batch}", file=sys.stderr)
+        sys.exit(1)
     
-    result = recalc(filename, timeout)
-    print(json.dumps(result, indent=2))
+    for result in recalc_batch(filenames, args.jobs, timeout):
+        print(json.dumps(result), flush=True)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()